@@ -10,6 +10,11 @@ Core Concept:
 
 Usage:
     python3 scripts/generate_phase_plan_v2.py path/to/config.json [output_dir]
+    python3 scripts/generate_phase_plan_v2.py path/to/config.json --engine jinja
+    python3 scripts/generate_phase_plan_v2.py path/to/config.json --force
+
+    With several arguments, the last is the output directory when it is an
+    existing directory, or does not exist and does not end in .json.
 
 Features:
     - Transforms structured data into natural narrative flow
@@ -24,13 +29,118 @@ How it works:
     4. Outputs formatted markdown document
 """
 
+from __future__ import annotations
+
+import io
+import os
 import sys
 import json
+import hashlib
+import functools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import date
+
+# typing is only needed by type checkers; annotations are never evaluated
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, ClassVar, Collection, Sequence, TextIO
+
+# orjson is an optional, faster drop-in for parsing large configs
+_json_loads: Callable[[bytes], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# mypy_extensions ships with mypy; without it, e.g. when running from
+# source, mypyc_attr is a no-op class decorator
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[type], type]:  # type: ignore[misc]
+        return lambda cls: cls
+
+# Write buffer used when streaming a generated document to disk
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+# Set WORKPLAN_CACHE=0 to disable reuse of plans rendered from identical configs
+PLAN_CACHE_ENABLED = os.environ.get('WORKPLAN_CACHE', '1') == '1'
+
+# Rendered plans a long-lived generator keeps, least recently used evicted first
+PLAN_CACHE_SIZE = 16
+
+# Precomputed indentation prefixes, indexed by nesting level
+_INDENTS: tuple[str, ...] = tuple("  " * i for i in range(16))
+
+# Row templates for list-of-dict config sections, rendered with str.format_map
+_EXAMPLE_FILE_FMT = "- **[{name}]({path})** - {description} - {purpose}"
+_SPEC_FMT = "- **[{name}]({path})** - {description}"
+_GUIDE_FMT = "- **[{name}]({path})** - {description}\n    - *When to read*: {when_to_read}"
+_QUICK_LINK_FMT = "- **{name}**: `{command}` - {purpose}"
+_COMPONENT_FMT = "  - {name} ({estimated_lines}) - {purpose}"
+_CRITERION_FMT = "- [ ] {criterion}\n    - *Verification*: {verification_method}"
+_KNOWLEDGE_AREA_FMT = "    - **{area}**: {description} (*{importance}*)"
+
+
+def today_iso() -> str:
+    """Today's local date as YYYY-MM-DD."""
+    return date.today().isoformat()
+
+
+# Rendering backends: the built-in section generators, or the optional
+# compiled Jinja2 template in scripts/templates/
+ENGINES = ('python', 'jinja')
+WORK_PLAN_TEMPLATE = "work_plan.md.j2"
+
+
+def module_path() -> Path:
+    """
+    Absolute path of this module's file, whether it runs from source or
+    as the mypyc-compiled extension.
+
+    Under mypyc the global __file__ is only the bare file name, so the
+    path is taken from the module object, which the import system gives
+    the full path of the .py or .so it was loaded from.
+    """
+    return Path(os.path.abspath(sys.modules[__name__].__file__ or __file__))
+
+
+def template_dir() -> Path:
+    """Directory holding the Jinja2 templates, next to this module."""
+    return module_path().parent / "templates"
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(name: str = WORK_PLAN_TEMPLATE):
+    """
+    Load and compile a Jinja2 template from template_dir().
+
+    Templates are compiled once per process and reused across generator
+    instances.
+
+    Raises:
+        RuntimeError: If Jinja2 is not installed
+    """
+    try:
+        import jinja2
+    except ImportError:
+        raise RuntimeError(
+            "The jinja engine requires Jinja2 (pip install jinja2)") from None
 
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(template_dir())),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        undefined=jinja2.StrictUndefined,
+    )
+    return env.get_template(name)
 
+
+# Compiled classes reject Python subclasses unless they opt in
+@mypyc_attr(allow_interpreted_subclasses=True)
 class NarrativeWorkPlanGenerator:
     """
     Transforms JSON configurations into narrative markdown documents.
@@ -43,21 +153,83 @@ class NarrativeWorkPlanGenerator:
         - load_config(): Validates and loads JSON input
         - generate_*(): Section-specific generators that format content
         - add_line(): Helper for building markdown with proper spacing
+        - SECTION_PIPELINE: Section order and which sections are optional
         - generate_plan(): Orchestrates the document generation
     
     To adapt for other document types:
         1. Subclass this generator
-        2. Override section generators as needed
-        3. Modify required_sections in load_config()
+        2. Override section generators and SECTION_PIPELINE as needed
+        3. Override REQUIRED_SECTIONS
         4. Add new generator methods for new sections
     """
-    
-    def __init__(self):
-        """Initialize the generator with empty config and output buffer."""
-        self.config: Dict[str, Any] = {}
-        self.output_lines: List[str] = []
-        
-    def load_config(self, config_path: str) -> Dict[str, Any]:
+
+    # Top-level config keys that must be present for this document type.
+    # Override in subclasses for different document types. ClassVar, like
+    # the tables below, so the mypyc build looks it up on the subclass.
+    REQUIRED_SECTIONS: ClassVar[Collection[str]] = frozenset({
+        'phase', 'prerequisites', 'resources', 'overview',
+        'methodology', 'done_criteria', 'work_breakdown',
+    })
+
+    # Document sections in output order as (config key, generator method).
+    # Sections with a config key are optional and only generated when that
+    # key is present; None marks sections that are always generated.
+    # The optional generators also return early on their own when their key
+    # is absent, so subclasses can still call them directly.
+    # Subclasses can reorder, drop or add entries.
+    SECTION_PIPELINE: ClassVar[Sequence[tuple[str | None, str]]] = (
+        (None, 'generate_header'),
+        (None, 'generate_prerequisites'),
+        (None, 'generate_resources'),
+        (None, 'generate_overview'),
+        ('build_commands', 'generate_build_commands'),
+        ('review_process', 'generate_review_process'),
+        (None, 'generate_methodology'),
+        (None, 'generate_done_criteria'),
+        (None, 'generate_work_breakdown'),
+        ('troubleshooting', 'generate_troubleshooting'),
+        ('security_requirements', 'generate_security_requirements'),
+        ('learning_path', 'generate_learning_path'),
+        ('next_phase', 'generate_next_phase'),
+        (None, 'generate_footer'),
+    )
+
+    # Work breakdown row kinds and the method that emits each one
+    ROW_EMITTERS: ClassVar[dict[str, str]] = {
+        'section_header': 'generate_section_header',
+        'task': 'generate_task',
+        'checkpoint': 'generate_checkpoint',
+    }
+
+    # Icon and display title for each task tip type
+    _TIP_ICONS: ClassVar[dict[str, str]] = {'junior_dev': '💡', 'warning': '⚠️',
+                  'security': '🔒', 'performance': '⚡'}
+    _TIP_TITLES: ClassVar[dict[str, str]] = {t: t.replace('_', ' ').title() for t in _TIP_ICONS}
+
+    def __init__(self, engine: str = 'python',
+                 cache_plans: bool = PLAN_CACHE_ENABLED):
+        """
+        Initialize the generator with empty config and output buffer.
+
+        Args:
+            engine: 'python' to run the generate_*() section methods, or
+                'jinja' to render the compiled work plan template instead
+            cache_plans: Keep rendered plans for reuse by later
+                generate_plan() calls. Cached renders are built in memory,
+                so one-shot generators should pass False to stream instead.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of: "
+                             f"{', '.join(ENGINES)}")
+        self.engine = engine
+        self.cache_plans = cache_plans
+        self.config: dict[str, Any] = {}
+        self._buf: TextIO = io.StringIO()
+        # (blake2b digest of the raw config bytes, render date) -> plan text
+        self._plan_cache: OrderedDict[tuple[bytes, str], str] = OrderedDict()
+        self._config_digest = b""
+        
+    def load_config(self, config_path: str) -> dict[str, Any]:
         """
         Load and validate JSON configuration file.
         
@@ -76,26 +248,25 @@ class NarrativeWorkPlanGenerator:
         """
         config_file = Path(config_path)
         
-        if not config_file.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        try:
+            data = config_file.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
         
+        self._config_digest = hashlib.blake2b(data, digest_size=16).digest()
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = _json_loads(data)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
         
-        # Define required sections for this document type
-        # Override in subclasses for different document types
-        required_sections = ['phase', 'prerequisites', 'resources', 'overview', 
-                           'methodology', 'done_criteria', 'work_breakdown']
-        
-        # Validate all required sections exist
-        missing_sections = [s for s in required_sections if s not in self.config]
+        self.check_required_sections(self.config)
+        return self.config
+    
+    def check_required_sections(self, config: dict[str, Any]) -> None:
+        """Raise ValueError naming any required sections absent from config."""
+        missing_sections = sorted(frozenset(self.REQUIRED_SECTIONS).difference(config))
         if missing_sections:
             raise ValueError(f"Missing required sections: {', '.join(missing_sections)}")
-        
-        return self.config
     
     def add_line(self, content: str = "", level: int = 0) -> None:
         """
@@ -109,9 +280,25 @@ class NarrativeWorkPlanGenerator:
             level: Indentation level (number of 2-space indents)
         """
         if level > 0:
-            content = "  " * level + content
-        self.output_lines.append(content)
-    
+            prefix = _INDENTS[level] if level < len(_INDENTS) else "  " * level
+            self._buf.write(prefix)
+        self._buf.write(content)
+        self._buf.write("\n")
+
+    def add_lines(self, lines: list[str]) -> None:
+        """
+        Add several pre-formatted lines to the output in a single write.
+
+        Use this instead of repeated add_line() calls when a block of
+        output is built up front. Indentation must already be applied.
+
+        Args:
+            lines: The lines to add, in order (empty strings for blank lines)
+        """
+        if lines:
+            self._buf.write("\n".join(lines))
+            self._buf.write("\n")
+
     def add_section_break(self) -> None:
         """Add a blank line for visual separation between sections."""
         self.add_line()
@@ -130,75 +317,64 @@ class NarrativeWorkPlanGenerator:
     def generate_prerequisites(self) -> None:
         """Generate prerequisites section with narrative flow."""
         prereq = self.config['prerequisites']
-        
-        self.add_line("## Prerequisites")
-        self.add_section_break()
-        self.add_line(prereq['intro_narrative'])
-        
+
+        parts: list[str] = ["## Prerequisites", "", prereq['intro_narrative']]
+
         # Completed phases
         if prereq.get('completed_phases'):
-            self.add_line(f"- **Completed Phases**: {prereq['completed_phases']['required']} - "
+            parts.append(f"- **Completed Phases**: {prereq['completed_phases']['required']} - "
                          f"{prereq['completed_phases']['descriptions']}")
-        
+
         # Knowledge areas
-        self.add_line("- **Required Knowledge**:")
-        for area in prereq['knowledge_areas']:
-            self.add_line(f"  - **{area['area']}**: {area['description']} "
-                         f"(*{area['importance']}*)", level=1)
-        
-        self.add_section_break()
-        
+        parts.append("- **Required Knowledge**:")
+        parts.extend(map(_KNOWLEDGE_AREA_FMT.format_map, prereq['knowledge_areas']))
+        parts.append("")
+        self.add_lines(parts)
+
     def generate_resources(self) -> None:
         """Generate resources section with descriptions."""
         resources = self.config['resources']
-        
-        self.add_line("## Quick Reference - Essential Resources")
-        self.add_section_break()
-        self.add_line(resources['intro_narrative'])
-        self.add_section_break()
-        
+
+        self.add_lines(["## Quick Reference - Essential Resources", "",
+                        resources['intro_narrative'], ""])
+
         # Example files
-        self.add_line("### Example Files")
+        parts: list[str] = ["### Example Files"]
         if resources['example_files']:
             # Extract directory from first file path
             first_path = Path(resources['example_files'][0]['path'])
             example_dir = str(first_path.parent)
-            self.add_line(f"All example files are located in `{example_dir}/`:")
-        for example in resources['example_files']:
-            self.add_line(f"- **[{example['name']}]({example['path']})** - "
-                         f"{example['description']} - {example['purpose']}")
-        
-        self.add_section_break()
-        
+            parts.append(f"All example files are located in `{example_dir}/`:")
+        parts.extend(map(_EXAMPLE_FILE_FMT.format_map, resources['example_files']))
+        parts.append("")
+        self.add_lines(parts)
+
         # Specifications
-        self.add_line("### Specification Documents")
-        self.add_line("Key specifications for this phase:")
-        for spec in resources['specifications']:
-            self.add_line(f"- **[{spec['name']}]({spec['path']})** - {spec['description']}")
-            if spec.get('key_sections'):
-                sections = ", ".join(spec['key_sections'])
-                self.add_line(f"  - Key sections: {sections}", level=1)
-        
-        self.add_section_break()
-        
+        self.add_lines([
+            "### Specification Documents",
+            "Key specifications for this phase:",
+            *(_SPEC_FMT.format_map(spec)
+              + (f"\n    - Key sections: {', '.join(spec['key_sections'])}"
+                 if spec.get('key_sections') else "")
+              for spec in resources['specifications']),
+            "",
+        ])
+
         # Junior developer guides
-        self.add_line("### Junior Developer Resources")
-        self.add_line("Additional learning resources organized by when you'll need them:")
-        for guide in resources['junior_dev_guides']:
-            self.add_line(f"- **[{guide['name']}]({guide['path']})** - "
-                         f"{guide['description']}")
-            self.add_line(f"  - *When to read*: {guide['when_to_read']}", level=1)
-        
-        self.add_section_break()
-        
+        self.add_lines([
+            "### Junior Developer Resources",
+            "Additional learning resources organized by when you'll need them:",
+            *map(_GUIDE_FMT.format_map, resources['junior_dev_guides']),
+            "",
+        ])
+
         # Quick links
-        self.add_line("### Quick Links")
-        for link in resources['quick_links']:
-            self.add_line(f"- **{link['name']}**: `{link['command']}` - "
-                         f"{link['purpose']}")
-        
-        self.add_section_break()
-        
+        self.add_lines([
+            "### Quick Links",
+            *map(_QUICK_LINK_FMT.format_map, resources['quick_links']),
+            "",
+        ])
+
     def generate_overview(self) -> None:
         """Generate overview section."""
         overview = self.config['overview']
@@ -219,15 +395,16 @@ class NarrativeWorkPlanGenerator:
             
         build = self.config['build_commands']
         
-        self.add_line("## Build and Test Commands")
-        self.add_section_break()
-        self.add_line(build['intro_narrative'])
-        
-        for cmd in build['commands']:
-            self.add_line(f"- `{build['tool']} {cmd['command']}` - "
-                         f"{cmd['description']} ({cmd['when_to_use']})")
-        
-        self.add_section_break()
+        tool = build['tool']
+        self.add_lines([
+            "## Build and Test Commands",
+            "",
+            build['intro_narrative'],
+            *(f"- `{tool} {cmd['command']}` - "
+              f"{cmd['description']} ({cmd['when_to_use']})"
+              for cmd in build['commands']),
+            "",
+        ])
         
     def generate_review_process(self) -> None:
         """Generate review process section."""
@@ -269,134 +446,158 @@ class NarrativeWorkPlanGenerator:
         """Generate done criteria checklist."""
         done = self.config['done_criteria']
         
-        self.add_line("## Done Criteria Checklist")
-        self.add_section_break()
-        self.add_line(done['intro_narrative'])
-        
-        for criterion in done['checklist']:
-            self.add_line(f"- [ ] {criterion['criterion']}")
-            self.add_line(f"  - *Verification*: {criterion['verification_method']}", level=1)
-        
-        self.add_section_break()
+        self.add_lines([
+            "## Done Criteria Checklist",
+            "",
+            done['intro_narrative'],
+            *map(_CRITERION_FMT.format_map, done['checklist']),
+            "",
+        ])
         
     def generate_work_breakdown(self) -> None:
-        """Generate detailed work breakdown sections."""
+        """
+        Generate detailed work breakdown sections.
+
+        All sections are flattened into one list of rows up front and
+        emitted in a single loop, rather than nesting a call per section.
+        """
         self.add_line("## Work Breakdown with Review Checkpoints")
         self.add_section_break()
-        
+
+        rows: list[tuple[str, dict[str, Any]]] = []
         for section in self.config['work_breakdown']:
-            self.generate_work_section(section)
-            
-    def generate_work_section(self, section: Dict[str, Any]) -> None:
-        """Generate a single work section with all details."""
-        # Section header
-        self.add_line(f"### {section['section_number']} {section['title']} "
-                     f"({section['work_unit_context']['scope']['estimated_lines']}, "
-                     f"{section['work_unit_context']['scope']['file_count']})")
-        self.add_section_break()
-        
-        # Work unit context
-        context = section['work_unit_context']
-        self.add_line("**Work Unit Context:**")
-        self.add_line(f"- **Complexity**: {context['complexity']} - "
-                     f"{context['complexity_reason']}")
-        self.add_line(f"- **Scope**: {context['scope']['estimated_lines']} across "
-                     f"{context['scope']['file_count']}")
-        self.add_line("- **Key Components**:")
-        
-        for component in context['key_components']:
-            self.add_line(f"  - {component['name']} ({component['estimated_lines']}) - "
-                         f"{component['purpose']}")
-        
-        if context.get('patterns'):
-            self.add_line(f"- **Patterns**: {', '.join(context['patterns'])}")
-        
-        if context.get('algorithms'):
-            self.add_line(f"- **Required Algorithms**: {', '.join(context['algorithms'])}")
-        
-        self.add_section_break()
-        
-        # Tasks
-        for task in section['tasks']:
-            self.generate_task(task)
-        
-        # Checkpoint
+            rows.extend(self.work_section_rows(section))
+        self.emit_rows(rows)
+
+    def work_section_rows(self, section: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Flatten a work section into (kind, payload) rows in output order.
+
+        Kinds are keys of ROW_EMITTERS: the section header, each task, and
+        the checkpoint if the section has one.
+        """
+        rows: list[tuple[str, dict[str, Any]]] = [('section_header', section)]
+        rows.extend(('task', task) for task in section['tasks'])
         if 'checkpoint' in section:
-            self.generate_checkpoint(section['checkpoint'])
-            
-    def generate_task(self, task: Dict[str, Any]) -> None:
+            rows.append(('checkpoint', section['checkpoint']))
+        return rows
+
+    def emit_rows(self, rows: list[tuple[str, dict[str, Any]]]) -> None:
+        """Emit pre-materialized rows through their ROW_EMITTERS methods."""
+        # Bind each emitter once so subclass overrides are honored
+        emitters = {kind: getattr(self, method)
+                    for kind, method in self.ROW_EMITTERS.items()}
+        for kind, payload in rows:
+            emitters[kind](payload)
+
+    def generate_work_section(self, section: dict[str, Any]) -> None:
+        """Generate a single work section with all details."""
+        self.emit_rows(self.work_section_rows(section))
+
+    def generate_section_header(self, section: dict[str, Any]) -> None:
+        """Generate a work section's header and work unit context."""
+        # Resolve nested lookups once
+        context: dict[str, Any] = section['work_unit_context']
+        scope: dict[str, Any] = context['scope']
+        estimated_lines = scope['estimated_lines']
+        file_count = scope['file_count']
+        patterns = context.get('patterns')
+        algorithms = context.get('algorithms')
+
+        # Section header and work unit context
+        parts: list[str] = [
+            f"### {section['section_number']} {section['title']} "
+            f"({estimated_lines}, {file_count})",
+            "",
+            "**Work Unit Context:**",
+            f"- **Complexity**: {context['complexity']} - {context['complexity_reason']}",
+            f"- **Scope**: {estimated_lines} across {file_count}",
+            "- **Key Components**:",
+        ]
+        parts.extend(map(_COMPONENT_FMT.format_map, context['key_components']))
+
+        if patterns:
+            parts.append(f"- **Patterns**: {', '.join(patterns)}")
+
+        if algorithms:
+            parts.append(f"- **Required Algorithms**: {', '.join(algorithms)}")
+
+        parts.append("")
+        self.add_lines(parts)
+
+    def generate_task(self, task: dict[str, Any]) -> None:
         """Generate a single task with full details."""
-        self.add_line(f"#### Task {task['number']}: {task['title']}")
-        self.add_section_break()
-        
+        # Resolve optional fields once; tuple defaults avoid a new list per call
+        tips = task.get('tips', ())
+        examples = task.get('code_examples', ())
+        tdd_instructions = task.get('tdd_instructions')
+        considerations = task.get('special_considerations')
+        tip_icons: dict[str, str] = self._TIP_ICONS
+        tip_titles: dict[str, str] = self._TIP_TITLES
+
+        parts: list[str] = [f"#### Task {task['number']}: {task['title']}", ""]
+
         # Tips/warnings before description
-        for tip in task.get('tips', []):
-            icon = {'junior_dev': '💡', 'warning': '⚠️', 
-                   'security': '🔒', 'performance': '⚡'}[tip['type']]
-            self.add_line(f"{icon} **{tip['type'].replace('_', ' ').title()} Tip**: "
+        for tip in tips:
+            tip_type = tip['type']
+            parts.append(f"{tip_icons[tip_type]} **{tip_titles[tip_type]} Tip**: "
                          f"{tip['content']}")
-            if tip.get('resource_link'):
-                self.add_line(f"   See: [{tip['resource_link']}]({tip['resource_link']})")
-            self.add_line()
-        
+            resource_link = tip.get('resource_link')
+            if resource_link:
+                parts.append(f"   See: [{resource_link}]({resource_link})")
+            parts.append("")
+
         # Task description
-        self.add_line(task['description'])
-        self.add_section_break()
-        
+        parts.extend((task['description'], ""))
+
         # TDD instructions if present
-        if task.get('tdd_instructions'):
-            self.add_line(f"**TDD Approach**: {task['tdd_instructions']}")
-            self.add_section_break()
-        
-        # Code examples
-        for example in task.get('code_examples', []):
-            self.add_line(f"**{example['purpose']}:**")
-            self.add_line(f"```{example['language']}")
-            self.add_line(example['code'])
-            self.add_line("```")
-            self.add_line()
-            self.add_line(f"*{example['explanation']}*")
-            self.add_section_break()
-        
+        if tdd_instructions:
+            parts.extend((f"**TDD Approach**: {tdd_instructions}", ""))
+
+        # Code examples, one pre-joined block each
+        parts.extend(f"**{example['purpose']}:**\n"
+                     f"```{example['language']}\n"
+                     f"{example['code']}\n"
+                     f"```\n"
+                     f"\n"
+                     f"*{example['explanation']}*\n"
+                     for example in examples)
+
         # Special considerations
-        if task.get('special_considerations'):
-            self.add_line("**Special Considerations:**")
-            for consideration in task['special_considerations']:
-                self.add_line(f"- {consideration}")
-            self.add_section_break()
+        if considerations:
+            parts.append("**Special Considerations:**")
+            parts.extend(f"- {consideration}" for consideration in considerations)
+            parts.append("")
+
+        self.add_lines(parts)
             
-    def generate_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+    def generate_checkpoint(self, checkpoint: dict[str, Any]) -> None:
         """Generate checkpoint section."""
-        self.add_line(f"---")
-        self.add_section_break()
-        self.add_line(f"### {checkpoint['stop_message']}")
-        self.add_section_break()
-        
+        parts: list[str] = ["---", "", f"### {checkpoint['stop_message']}", ""]
+
         # Deliverables
-        self.add_line("**Deliverables:**")
-        for deliverable in checkpoint['deliverables']:
-            self.add_line(f"- {deliverable}")
-        self.add_section_break()
-        
+        parts.append("**Deliverables:**")
+        parts.extend(f"- {deliverable}" for deliverable in checkpoint['deliverables'])
+        parts.append("")
+
         # Verification steps
-        self.add_line("**Verification Steps:**")
-        for i, step in enumerate(checkpoint['verification_steps'], 1):
-            self.add_line(f"{i}. {step}")
-        self.add_section_break()
-        
+        parts.append("**Verification Steps:**")
+        parts.extend(f"{i}. {step}"
+                     for i, step in enumerate(checkpoint['verification_steps'], 1))
+        parts.append("")
+
         # Common issues
         if checkpoint.get('common_issues'):
-            self.add_line("**Common Issues:**")
+            parts.append("**Common Issues:**")
             for issue in checkpoint['common_issues']:
-                self.add_line(f"- **Issue**: {issue['issue']}")
-                self.add_line(f"  **Solution**: {issue['solution']}")
-            self.add_section_break()
-        
-        self.add_line("**DO NOT PROCEED** until review is complete and approved.")
-        self.add_section_break()
-        self.add_line(f"---")
-        self.add_section_break()
-        
+                parts.extend((f"- **Issue**: {issue['issue']}",
+                              f"  **Solution**: {issue['solution']}"))
+            parts.append("")
+
+        parts.extend(("**DO NOT PROCEED** until review is complete and approved.", "",
+                      "---", ""))
+        self.add_lines(parts)
+
     def generate_troubleshooting(self) -> None:
         """Generate troubleshooting section."""
         if 'troubleshooting' not in self.config:
@@ -404,27 +605,26 @@ class NarrativeWorkPlanGenerator:
             
         trouble = self.config['troubleshooting']
         
-        self.add_line("## Troubleshooting")
-        self.add_section_break()
-        self.add_line(trouble['intro_narrative'])
-        self.add_section_break()
-        
+        parts: list[str] = ["## Troubleshooting", "", trouble['intro_narrative'], ""]
+
         for category in trouble['common_issues']:
-            self.add_line(f"### {category['category']}")
+            parts.append(f"### {category['category']}")
             for issue in category['issues']:
-                self.add_line(f"- **Symptom**: {issue['symptom']}")
-                self.add_line(f"  - **Cause**: {issue['cause']}", level=1)
-                self.add_line(f"  - **Solution**: {issue['solution']}", level=1)
-            self.add_section_break()
-        
+                parts.extend((f"- **Symptom**: {issue['symptom']}",
+                              f"    - **Cause**: {issue['cause']}",
+                              f"    - **Solution**: {issue['solution']}"))
+            parts.append("")
+
         # Escalation path
         if trouble.get('escalation_path'):
-            self.add_line("### Escalation Path")
-            self.add_line(trouble['escalation_path']['when_stuck'])
-            self.add_line("**Documentation Requirements:**")
-            for req in trouble['escalation_path']['documentation_requirements']:
-                self.add_line(f"- {req}")
-            self.add_section_break()
+            parts.extend(("### Escalation Path",
+                          trouble['escalation_path']['when_stuck'],
+                          "**Documentation Requirements:**"))
+            parts.extend(f"- {req}"
+                         for req in trouble['escalation_path']['documentation_requirements'])
+            parts.append("")
+
+        self.add_lines(parts)
             
     def generate_security_requirements(self) -> None:
         """Generate security requirements section."""
@@ -512,94 +712,253 @@ class NarrativeWorkPlanGenerator:
         """Generate document footer."""
         self.add_line("---")
         self.add_line()
-        self.add_line(f"*Generated on {datetime.now().strftime('%Y-%m-%d')} "
+        self.add_line(f"*Generated on {today_iso()} "
                      f"by Phase Plan Generator v2*")
         
+    def render_template(self) -> None:
+        """
+        Render the whole document through the compiled Jinja2 template.
+
+        Produces the same output as the generate_*() methods, streamed
+        into the output buffer chunk by chunk.
+        """
+        example_files = self.config['resources']['example_files']
+        example_dir = str(Path(example_files[0]['path']).parent) if example_files else ""
+        load_template().stream(
+            config=self.config,
+            example_dir=example_dir,
+            tip_icons=self._TIP_ICONS,
+            tip_titles=self._TIP_TITLES,
+            today=today_iso(),
+        ).dump(self._buf)
+
     def ensure_output_directory(self, phase_number: int, 
-                              project_root: Optional[str] = None) -> Path:
+                              project_root: str | None = None) -> Path:
         """Create output directory if it doesn't exist."""
-        if project_root is None:
-            project_root = Path.cwd()
-        else:
-            project_root = Path(project_root)
+        root = Path.cwd() if project_root is None else Path(project_root)
         
-        output_dir = project_root / ".claude" / ".plan" / f"phase-{phase_number}"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = root / ".claude" / ".plan" / f"phase-{phase_number}"
+        # Regenerating an existing phase is the common case: one stat instead
+        # of a mkdir per path component
+        if not output_dir.is_dir():
+            output_dir.mkdir(parents=True, exist_ok=True)
         
         return output_dir
         
+    def is_up_to_date(self, output_file: Path, config_path: str) -> bool:
+        """
+        Check whether a previously generated document can be reused.
+
+        The output is current when it exists and is at least as new as
+        every input it was built from: the config, the generator module(s)
+        and, for the jinja engine, the template.
+        """
+        try:
+            output_mtime = output_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+        inputs = {Path(config_path), module_path()}
+        subclass_file = getattr(sys.modules.get(type(self).__module__), '__file__', None)
+        if subclass_file:
+            inputs.add(Path(subclass_file))
+        if self.engine == 'jinja':
+            inputs.add(template_dir() / WORK_PLAN_TEMPLATE)
+
+        return all(path.stat().st_mtime_ns <= output_mtime for path in inputs)
+
+    def render_sections(self) -> None:
+        """Write every section of the loaded config to the output buffer."""
+        if self.engine == 'jinja':
+            self.render_template()
+        else:
+            # Generate all sections in order, skipping absent optional ones
+            for key, method in self.SECTION_PIPELINE:
+                if key is None or key in self.config:
+                    getattr(self, method)()
+
+    def render_plan(self, config: dict[str, Any]) -> str:
+        """
+        Render a work plan from an already-parsed config, without touching disk.
+
+        Args:
+            config: Configuration dictionary, as load_config() would return
+
+        Returns:
+            The complete markdown document
+
+        Raises:
+            ValueError: If required sections are missing
+        """
+        self.check_required_sections(config)
+        self.config = config
+        self._buf = io.StringIO()
+        try:
+            self.render_sections()
+            return self._buf.getvalue()
+        finally:
+            self._buf = io.StringIO()
+
     def generate_plan(self, config_path: str, 
-                     project_root: Optional[str] = None) -> str:
-        """Main method: Generate complete narrative WORK_PLAN.md."""
+                     project_root: str | None = None,
+                     force: bool = False) -> str:
+        """
+        Main method: Generate complete narrative WORK_PLAN.md.
+
+        Generation is skipped when the existing output is already up to
+        date (see is_up_to_date()), and a plan this generator already
+        rendered today from byte-identical config content is written out
+        again rather than re-rendered. Pass force=True to always regenerate.
+        """
         # Load configuration
         self.load_config(config_path)
         
-        # Clear output
-        self.output_lines = []
-        
-        # Generate all sections in order
-        self.generate_header()
-        self.generate_prerequisites()
-        self.generate_resources()
-        self.generate_overview()
-        self.generate_build_commands()
-        self.generate_review_process()
-        self.generate_methodology()
-        self.generate_done_criteria()
-        self.generate_work_breakdown()
-        self.generate_troubleshooting()
-        self.generate_security_requirements()
-        self.generate_learning_path()
-        self.generate_next_phase()
-        self.generate_footer()
-        
         # Determine output location
         phase_number = self.config['phase']['number']
         output_dir = self.ensure_output_directory(phase_number, project_root)
         output_file = output_dir / "WORK_PLAN.md"
         
-        # Write output file
-        content = '\n'.join(self.output_lines)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+        if not force and self.is_up_to_date(output_file, config_path):
+            return str(output_file)
+        
+        # Write the plan to a temporary sibling file, then move it into place
+        # so a failed generation never leaves a partial plan behind
+        tmp_file = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+        use_cache = self.cache_plans and not force
+        # The footer carries the render date, so plans are reused within a day
+        cache_key = (self._config_digest, today_iso())
+        plan = self._plan_cache.get(cache_key) if use_cache else None
+        if plan is not None:
+            self._plan_cache.move_to_end(cache_key)
+        try:
+            with open(tmp_file, 'w', encoding='utf-8',
+                      buffering=OUTPUT_BUFFER_SIZE) as out:
+                if plan is not None:
+                    out.write(plan)
+                elif use_cache:
+                    # Render in memory so the text can be kept for reuse
+                    self._buf = io.StringIO()
+                    self.render_sections()
+                    plan = self._buf.getvalue()
+                    out.write(plan)
+                else:
+                    self._buf = out
+                    self.render_sections()
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        finally:
+            self._buf = io.StringIO()
+        
+        if plan is not None:
+            self._plan_cache[cache_key] = plan
+            if len(self._plan_cache) > PLAN_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
         return str(output_file)
 
 
-def main():
+def generate_one(config_path: str, project_root: str | None = None,
+                 engine: str = 'python', force: bool = False) -> str:
+    """
+    Generate a single work plan with a fresh generator.
+
+    Module-level so it can be dispatched to worker processes. The
+    generator is used once, so it streams to disk instead of caching.
+    """
+    generator = NarrativeWorkPlanGenerator(engine=engine, cache_plans=False)
+    return generator.generate_plan(config_path, project_root, force=force)
+
+
+def main(argv: list[str] | None = None) -> int:
     """
     Command-line interface entry point.
     
     Parses arguments and runs the generator.
     Provides helpful usage information if arguments missing.
+    Several configs are generated in parallel worker processes.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit status
     """
-    if len(sys.argv) < 2:
-        print("Usage: python3 scripts/generate_phase_plan_v2.py <config.json> [output_dir]", 
-              file=sys.stderr)
-        print("", file=sys.stderr)
-        print("This script generates narrative documents from JSON configurations.", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("Arguments:", file=sys.stderr)
-        print("  config.json  - Path to JSON configuration with complete content", file=sys.stderr)
-        print("  output_dir   - Optional output directory (defaults to current dir)", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("Example:", file=sys.stderr)
-        print("  python3 scripts/generate_phase_plan_v2.py phase-5-config.json ./output", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("See .claude/examples/phase-5-complete-config.json for a complete example.", file=sys.stderr)
-        sys.exit(1)
-    
-    config_path = sys.argv[1]
-    project_root = sys.argv[2] if len(sys.argv) > 2 else None
-    
-    try:
-        generator = NarrativeWorkPlanGenerator()
-        output_file = generator.generate_plan(config_path, project_root)
-        print(f"Generated narrative work plan: {output_file}")
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    import argparse
+    from concurrent.futures import ProcessPoolExecutor
+
+    parser = argparse.ArgumentParser(
+        description="Generate narrative documents from JSON configurations.",
+        epilog="Examples:\n"
+               "  python3 scripts/generate_phase_plan_v2.py phase-5-config.json ./output\n"
+               "  python3 scripts/generate_phase_plan_v2.py phase-*-config.json ./output\n\n"
+               "See .claude/examples/phase-5-complete-config.json for a complete example.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="config.json [output_dir]",
+        help="One or more JSON configurations with complete content, optionally "
+             "followed by an output directory (defaults to current dir). The last "
+             "argument is the output directory if it is an existing directory, or "
+             "does not exist and does not end in .json"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help="Rendering backend: built-in section generators (default) "
+             "or the compiled Jinja2 template"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate even if the existing output is newer than its inputs"
+    )
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        parser.print_help(sys.stderr)
+        return 1
+
+    args = parser.parse_args(argv)
+
+    # The last of several arguments is the output directory when it is an
+    # existing directory, or a new path not named like a JSON config; an
+    # existing file is always a config, whatever its extension
+    config_paths = args.paths
+    project_root = None
+    last = config_paths[-1]
+    if len(config_paths) > 1 and (os.path.isdir(last) or (
+            not os.path.exists(last) and not last.lower().endswith('.json'))):
+        *config_paths, project_root = config_paths
+
+    if len(config_paths) == 1:
+        try:
+            output_file = generate_one(config_paths[0], project_root,
+                                       args.engine, args.force)
+            print(f"Generated narrative work plan: {output_file}")
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    failed = False
+    with ProcessPoolExecutor(max_workers=min(len(config_paths), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(generate_one, config_path, project_root,
+                               args.engine, args.force)
+                   for config_path in config_paths]
+        for config_path, future in zip(config_paths, futures):
+            try:
+                print(f"Generated narrative work plan: {future.result()}")
+            except Exception as e:
+                print(f"Error: {config_path}: {e}", file=sys.stderr)
+                failed = True
+
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
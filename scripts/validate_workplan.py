@@ -24,12 +24,25 @@ rules that ensure professional quality output.
 import sys
 import json
 import re
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Issue categories, interned so filtering issues by category compares by identity
+CATEGORY_ACTIONABILITY = sys.intern("Actionability")
+CATEGORY_COMPLETENESS = sys.intern("Completeness")
+CATEGORY_CONFIG = sys.intern("Config")
+CATEGORY_CONFIG_SCHEMA = sys.intern("Config Schema")
+CATEGORY_CONTENT_QUALITY = sys.intern("Content Quality")
+CATEGORY_FILE = sys.intern("File")
+CATEGORY_MARKDOWN = sys.intern("Markdown")
+CATEGORY_SECURITY = sys.intern("Security")
+CATEGORY_STRUCTURE = sys.intern("Structure")
+
+
 class ValidationLevel(Enum):
     """Severity levels for validation issues."""
     ERROR = "ERROR"
@@ -79,30 +92,47 @@ class WorkPlanValidator:
         self.issues: List[ValidationIssue] = []
         self.lines: List[str] = []
         self.content: str = ""
+        # blake2b digest of a plan's bytes -> issues its checks produced
+        self._cache: Dict[bytes, Tuple[ValidationIssue, ...]] = {}
         
     def validate_file(self, file_path: str) -> Tuple[bool, List[ValidationIssue]]:
-        """Validate a work plan file."""
+        """
+        Validate a work plan file.
+        
+        Results are cached by content hash, so re-validating an unchanged
+        plan replays the earlier issues instead of re-running the checks.
+        """
         path = Path(file_path)
         
         if not path.exists():
             self.issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
-                "File",
+                CATEGORY_FILE,
                 f"Work plan file not found: {file_path}"
             ))
             return False, self.issues
         
-        with open(path, 'r', encoding='utf-8') as f:
-            self.content = f.read()
-            self.lines = self.content.splitlines()
-        
-        # Run all validation checks
-        self._check_completeness()
-        self._check_structure()
-        self._check_markdown_quality()
-        self._check_content_quality()
-        self._check_actionability()
-        self._check_security_coverage()
+        data = path.read_bytes()
+        self.content = data.decode('utf-8')
+        if '\r' in self.content:
+            # Match text-mode reads, which translate universal newlines
+            self.content = self.content.replace('\r\n', '\n').replace('\r', '\n')
+        self.lines = self.content.splitlines()
+        
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.issues.extend(cached)
+        else:
+            # Run all validation checks
+            first_new = len(self.issues)
+            self._check_completeness()
+            self._check_structure()
+            self._check_markdown_quality()
+            self._check_content_quality()
+            self._check_actionability()
+            self._check_security_coverage()
+            self._cache[key] = tuple(self.issues[first_new:])
         
         # Determine if validation passed
         has_errors = any(issue.level == ValidationLevel.ERROR for issue in self.issues)
@@ -124,7 +154,7 @@ class WorkPlanValidator:
             if todo_match := todo_pattern.search(line):
                 self.issues.append(ValidationIssue(
                     ValidationLevel.ERROR,
-                    "Completeness",
+                    CATEGORY_COMPLETENESS,
                     f"TODO marker found: {todo_match.group()}",
                     line_number=i,
                     context=line.strip()
@@ -144,7 +174,7 @@ class WorkPlanValidator:
             if section not in self.content:
                 self.issues.append(ValidationIssue(
                     ValidationLevel.ERROR,
-                    "Completeness",
+                    CATEGORY_COMPLETENESS,
                     f"Missing required section: {section}"
                 ))
     
@@ -168,7 +198,7 @@ class WorkPlanValidator:
             if current_level > prev_level + 1:
                 self.issues.append(ValidationIssue(
                     ValidationLevel.WARNING,
-                    "Structure",
+                    CATEGORY_STRUCTURE,
                     f"Header level jumped from {prev_level} to {current_level}",
                     line_number=header_levels[i][2],
                     context=f"# {'#' * (current_level-1)} {header_levels[i][1]}"
@@ -178,7 +208,7 @@ class WorkPlanValidator:
         if not header_levels or not header_levels[0][1].startswith("Phase"):
             self.issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
-                "Structure",
+                CATEGORY_STRUCTURE,
                 "Document must start with 'Phase X: Title - Work Plan' header"
             ))
     
@@ -195,7 +225,7 @@ class WorkPlanValidator:
                 if not link_url or link_url.isspace():
                     self.issues.append(ValidationIssue(
                         ValidationLevel.ERROR,
-                        "Markdown",
+                        CATEGORY_MARKDOWN,
                         f"Empty link URL for '{link_text}'",
                         line_number=i
                     ))
@@ -215,7 +245,7 @@ class WorkPlanValidator:
         if in_code_block:
             self.issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
-                "Markdown",
+                CATEGORY_MARKDOWN,
                 "Unclosed code block",
                 line_number=code_block_start
             ))
@@ -231,7 +261,7 @@ class WorkPlanValidator:
         if len(bullet_chars) > 1:
             self.issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
-                "Markdown",
+                CATEGORY_MARKDOWN,
                 f"Inconsistent bullet characters used: {bullet_chars}"
             ))
     
@@ -273,7 +303,7 @@ class WorkPlanValidator:
                 if line_count < min_count:
                     self.issues.append(ValidationIssue(
                         ValidationLevel.WARNING,
-                        "Content Quality",
+                        CATEGORY_CONTENT_QUALITY,
                         f"Section '{section}' seems too brief ({line_count} lines, "
                         f"expected at least {min_count})"
                     ))
@@ -291,7 +321,7 @@ class WorkPlanValidator:
                 if in_task and not has_context:
                     self.issues.append(ValidationIssue(
                         ValidationLevel.WARNING,
-                        "Content Quality",
+                        CATEGORY_CONTENT_QUALITY,
                         "Task lacks contextual explanation or tips"
                     ))
                 task_count += 1
@@ -308,7 +338,7 @@ class WorkPlanValidator:
         if task_count > 0 and tasks_with_context / task_count < 0.5:
             self.issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
-                "Content Quality",
+                CATEGORY_CONTENT_QUALITY,
                 f"Only {tasks_with_context}/{task_count} tasks have contextual tips"
             ))
     
@@ -339,7 +369,7 @@ class WorkPlanValidator:
                 if phrase in lower_line:
                     self.issues.append(ValidationIssue(
                         ValidationLevel.WARNING,
-                        "Actionability",
+                        CATEGORY_ACTIONABILITY,
                         f"Vague instruction found: '{phrase}'",
                         line_number=i,
                         context=line.strip()
@@ -357,7 +387,7 @@ class WorkPlanValidator:
         if len(commands_found) < 5:
             self.issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
-                "Actionability",
+                CATEGORY_ACTIONABILITY,
                 f"Few executable commands found ({len(commands_found)}), "
                 "work plan may lack specific instructions"
             ))
@@ -367,7 +397,7 @@ class WorkPlanValidator:
         if len(code_blocks) < 3:
             self.issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
-                "Actionability",
+                CATEGORY_ACTIONABILITY,
                 f"Only {len(code_blocks)} code examples found, "
                 "consider adding more for clarity"
             ))
@@ -392,7 +422,7 @@ class WorkPlanValidator:
         if security_mentions < 5:
             self.issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
-                "Security",
+                CATEGORY_SECURITY,
                 f"Limited security coverage ({security_mentions} mentions), "
                 "ensure security is adequately addressed"
             ))
@@ -405,7 +435,7 @@ class WorkPlanValidator:
         if not has_security_section:
             self.issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
-                "Security",
+                CATEGORY_SECURITY,
                 "No security section or requirements found"
             ))
     
@@ -416,7 +446,7 @@ class WorkPlanValidator:
         if not path.exists():
             self.issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
-                "Config",
+                CATEGORY_CONFIG,
                 f"Configuration file not found: {config_path}"
             ))
             return False, self.issues
@@ -427,7 +457,7 @@ class WorkPlanValidator:
         except json.JSONDecodeError as e:
             self.issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
-                "Config",
+                CATEGORY_CONFIG,
                 f"Invalid JSON: {e}"
             ))
             return False, self.issues
@@ -451,7 +481,7 @@ class WorkPlanValidator:
                 if field not in config:
                     self.issues.append(ValidationIssue(
                         ValidationLevel.ERROR,
-                        "Config Schema",
+                        CATEGORY_CONFIG_SCHEMA,
                         f"Missing required field: {path}.{field}" if path else field
                     ))
         
@@ -516,8 +546,16 @@ class WorkPlanValidator:
             print(f"    Context: {issue.context}")
 
 
-def main():
-    """CLI entry point."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    CLI entry point.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit status
+    """
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -543,7 +581,7 @@ def main():
         help="Only show summary, not detailed issues"
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.file and not args.config:
         parser.error("Either file or --config must be specified")
@@ -553,37 +591,26 @@ def main():
     if args.config:
         if args.check_generation:
             # Generate and validate
-            import subprocess
             import tempfile
+            from generate_phase_plan_v2 import generate_one
             
             # First validate config
             passed, issues = validator.validate_config(args.config)
             if not passed and not args.quiet:
                 validator.print_report(issues)
-                sys.exit(1)
-            
-            # Generate work plan
-            script_dir = Path(__file__).parent
-            generator_script = script_dir / "generate_phase_plan_v2.py"
+                return 1
             
+            # Generate work plan in-process
             with tempfile.TemporaryDirectory() as tmpdir:
-                result = subprocess.run(
-                    [sys.executable, str(generator_script), args.config, tmpdir],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Generation failed: {result.stderr}")
-                    sys.exit(1)
+                try:
+                    generated_file = generate_one(args.config, tmpdir)
+                except Exception as e:
+                    print(f"Generation failed: {e}")
+                    return 1
                 
-                # Find generated file
-                output_match = re.search(r'Generated narrative work plan: (.+)', result.stdout)
-                if output_match:
-                    generated_file = output_match.group(1)
-                    # Validate generated file
-                    validator.issues = []  # Reset issues
-                    passed, issues = validator.validate_file(generated_file)
+                # Validate generated file
+                validator.issues = []  # Reset issues
+                passed, issues = validator.validate_file(generated_file)
         else:
             # Just validate config
             passed, issues = validator.validate_config(args.config)
@@ -594,8 +621,8 @@ def main():
     if not args.quiet:
         validator.print_report(issues)
     
-    sys.exit(0 if passed else 1)
+    return 0 if passed else 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
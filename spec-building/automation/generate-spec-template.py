@@ -9,169 +9,29 @@ templates and documentation to ensure high-quality specs from the start.
 import sys
 import os
 from pathlib import Path
-from datetime import datetime
+from string import Formatter
+from types import MappingProxyType, SimpleNamespace
+from functools import lru_cache
 from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# No sys.path edits: under `python -m automation.generate-spec-template` the
+# package resolves from spec-building/, and run as a script this file's own
+# directory is already sys.path[0]
 try:
     from automation.lib.base import SpecTool
 except ImportError:
     # Fallback for direct execution
-    sys.path.insert(0, str(Path(__file__).parent))
     from lib.base import SpecTool
 
-class SpecTemplateGenerator(SpecTool):
-    """Generate spec templates with best practices built in."""
-    
-    VERSION = "3.0.0"
-    DESCRIPTION = "Generate comprehensive spec templates for new projects"
-    
-    # Template sets available
-    TEMPLATES = {
-        'basic': 'Minimal spec structure for simple projects',
-        'standard': 'Standard spec with all recommended sections (default)',
-        'comprehensive': 'Full enterprise spec with compliance sections'
-    }
-    
-    def create_parser(self):
-        parser = super().create_parser()
-        parser.add_argument('project_name', 
-                          help='Name of the project')
-        parser.add_argument('-o', '--output-dir', default='.',
-                          help='Output directory (default: current directory)')
-        parser.add_argument('-t', '--template', 
-                          choices=list(self.TEMPLATES.keys()),
-                          default='standard',
-                          help='Template set to use')
-        parser.add_argument('--list-templates', action='store_true',
-                          help='List available templates and exit')
-        parser.add_argument('--force', action='store_true',
-                          help='Overwrite existing directory')
-        return parser
-        
-    def get_examples(self):
-        return """
-Examples:
-  # Create standard spec for "My API"
-  %(prog)s "My API"
-  
-  # Use comprehensive template in specific directory
-  %(prog)s "Enterprise System" -o ./specs -t comprehensive
-  
-  # List available templates
-  %(prog)s --list-templates
-"""
-    
-    def execute(self) -> int:
-        if self.args.list_templates:
-            return self.list_templates()
-            
-        # Validate inputs
-        project_slug = self.args.project_name.lower().replace(' ', '-')
-        project_dir = Path(self.args.output_dir) / project_slug
-        
-        if project_dir.exists() and not self.args.force:
-            print(f"✗ Directory already exists: {project_dir}")
-            print("  Use --force to overwrite")
-            return 1
-            
-        # Create structure
-        print(f"\n🚀 Creating {self.args.template} spec structure for: {self.args.project_name}")
-        print(f"📁 Location: {project_dir.absolute()}\n")
-        
-        try:
-            self.create_structure(project_dir)
-            
-            print(f"\n✅ Spec structure created successfully!")
-            print(f"\n📝 Next steps:")
-            print(f"  1. cd {project_dir}")
-            print(f"  2. Review README.md for guidance")
-            print(f"  3. Complete templates in requirements/ directory:")
-            print(f"     - outcome-definition.md (define success)")
-            print(f"     - acceptance-scenarios.md (test cases)")
-            print(f"     - non-functional-requirements.md (quality)")
-            print(f"  4. Fill out the main spec/SPEC.md")
-            print(f"  5. Run validation:")
-            print(f"     python3 -m automation.score-spec-quality spec/SPEC.md")
-            
-            return 0
-            
-        except Exception as e:
-            print(f"\n✗ Error creating structure: {e}")
-            return 1
-        
-    def list_templates(self) -> int:
-        print("\nAvailable template sets:\n")
-        for name, desc in self.TEMPLATES.items():
-            default = " (default)" if name == "standard" else ""
-            print(f"  {name}{default}")
-            print(f"    {desc}\n")
-        return 0
-        
-    def create_structure(self, project_dir: Path):
-        """Create the project structure."""
-        # Create directories
-        directories = [
-            project_dir / "spec",
-            project_dir / "requirements",
-            project_dir / "roadmap",
-            project_dir / "phase-plans",
-            project_dir / "review",
-            project_dir / "validation"
-        ]
-        
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-            print(f"  ✓ Created: {directory.name}/")
-            
-        # Create files based on template type
-        if self.args.template == 'basic':
-            self.create_basic_templates(project_dir)
-        elif self.args.template == 'comprehensive':
-            self.create_comprehensive_templates(project_dir)
-        else:  # standard
-            self.create_standard_templates(project_dir)
-            
-        # Always create these files
-        self.create_common_files(project_dir)
-        
-    def create_common_files(self, project_dir: Path):
-        """Create files common to all templates."""
-        # Create .gitignore
-        gitignore_content = """# Spec building artifacts
-*.log
-*.tmp
-.DS_Store
-
-# Validation reports
-*-report.json
-*-validation.json
-validation/*.json
-validation/*.html
-
-# Review artifacts
-review/*.md
-!review/README.md
-
-# Editor files
-.vscode/
-.idea/
-*.swp
-*.bak
+# Template bodies in str.format syntax, compiled to bytes segments at import
+# (see _compile below); each render only fills the named placeholders from
+# the generator's shared fields. Literal braces are doubled.
+# The *_BODY templates follow a title line and have no placeholders at all,
+# so they are appended verbatim without being parsed.
 
-# Python
-__pycache__/
-*.pyc
-.pytest_cache/
-"""
-        (project_dir / ".gitignore").write_text(gitignore_content)
-        print(f"  ✓ Created: .gitignore")
-        
-        # Create main README
-        readme_content = f"""# {self.args.project_name} Specification
+_README_TEMPLATE = """# {project_name} Specification
 
-This directory contains the complete specification for the {self.args.project_name} project.
+This directory contains the complete specification for the {project_name} project.
 
 ## Quick Start
 
@@ -193,7 +53,7 @@ This directory contains the complete specification for the {self.args.project_na
 ## Directory Structure
 
 ```
-{project_dir.name}/
+{dir_name}/
 ├── spec/              # Main specification
 │   └── SPEC.md       # The primary spec document
 ├── requirements/      # Detailed requirements
@@ -241,297 +101,99 @@ python3 -m automation.validate-all spec/SPEC.md
 - [Example Specs](../example-project/)
 
 ---
-Created: {datetime.now().strftime('%Y-%m-%d')}
-Template: {self.args.template}
+Created: {today}
+Template: {template}
 """
-        (project_dir / "README.md").write_text(readme_content)
-        print(f"  ✓ Created: README.md")
-        
-    def create_standard_templates(self, project_dir: Path):
-        """Create standard template files."""
-        # Create a simpler SPEC.md that won't have formatting issues
-        spec_path = project_dir / "spec" / "SPEC.md"
-        spec_path.write_text(self.get_spec_template())
-        print("  ✓ Created: spec/SPEC.md")
-        
-        # Create requirements templates
-        outcome_path = project_dir / "requirements" / "outcome-definition.md"
-        outcome_path.write_text(self.get_outcome_template())
-        print("  ✓ Created: requirements/outcome-definition.md")
-        
-        scenarios_path = project_dir / "requirements" / "acceptance-scenarios.md"
-        scenarios_path.write_text(self.get_scenarios_template())
-        print("  ✓ Created: requirements/acceptance-scenarios.md")
-        
-        nfr_path = project_dir / "requirements" / "non-functional-requirements.md"
-        nfr_path.write_text(self.get_nfr_template())
-        print("  ✓ Created: requirements/non-functional-requirements.md")
-        
-    def create_basic_templates(self, project_dir: Path):
-        """Create minimal templates for simple projects."""
-        spec_content = f"""# {self.args.project_name} - Specification
-
-## Overview
-[Brief description of the project and its purpose]
 
-## Goals
-- Goal 1: [Specific, measurable goal]
-- Goal 2: [Another specific goal]
-- Goal 3: [Another goal]
+_SPEC_TEMPLATE = """# {project_name} - Project Specification
 
-## Requirements
+## Executive Summary
 
-### Must Have
-- [ ] [Critical requirement 1]
-- [ ] [Critical requirement 2]
-- [ ] [Critical requirement 3]
+[Provide a 2-3 paragraph overview of the project, covering:]
+- What problem this project solves
+- Who benefits and how
+- Expected business impact
+- High-level approach
 
-### Should Have
-- [ ] [Important but not critical requirement]
-- [ ] [Another important requirement]
+### Key Business Drivers
+- **Driver 1**: [Specific business need or opportunity]
+- **Driver 2**: [Market pressure or competitive advantage]
+- **Driver 3**: [Efficiency or cost consideration]
 
-### Nice to Have
-- [ ] [Optional enhancement]
+### Success Criteria
+| Criterion | Target | Measurement |
+|-----------|--------|-------------|
+| [Business Metric] | [Specific Target] | [How Measured] |
+| [User Adoption] | [Target Percentage] | [Measurement Method] |
+| [Performance] | [Target Value] | [Measurement Tool] |
 
-## Success Criteria
-- [How we know the project succeeded]
-- [Another success indicator]
-- [Measurable outcome]
+## Stakeholders
 
-## Technical Approach
-[High-level description of the technical solution]
+| Role | Name | Responsibilities | Approval Authority |
+|------|------|------------------|-------------------|
+| Executive Sponsor | [Name] | Strategic oversight, funding | Final go/no-go |
+| Product Owner | [Name] | Requirements, priorities | Feature approval |
+| Technical Lead | [Name] | Architecture, technical decisions | Technical approval |
+| QA Lead | [Name] | Quality standards, testing | Quality gates |
+| User Representative | [Name] | User needs, UAT | User acceptance |
 
-## Risks
-| Risk | Impact | Probability | Mitigation |
-|------|--------|-------------|------------|
-| [Risk description] | High/Medium/Low | High/Medium/Low | [How to handle] |
+## Requirements
 
-## Timeline
-- Phase 1: [What] - [Duration] - [Deliverable]
-- Phase 2: [What] - [Duration] - [Deliverable]
+### Functional Requirements
 
----
-Created: {datetime.now().strftime('%Y-%m-%d')}
-"""
-        (project_dir / "spec" / "SPEC.md").write_text(spec_content)
-        print("  ✓ Created: spec/SPEC.md (basic)")
-        
-    def create_comprehensive_templates(self, project_dir: Path):
-        """Create enterprise-grade templates."""
-        # Start with standard templates
-        self.create_standard_templates(project_dir)
-        
-        # Add additional enterprise files
-        security_content = f"""# Security Requirements - {self.args.project_name}
+#### FR-001: [Core Feature Name]
+**Priority**: Must Have  
+**Description**: The system shall [specific capability]
 
-## Security Architecture
+**Acceptance Criteria**:
+- [ ] [Specific, measurable criterion]
+- [ ] [Another measurable criterion]
+- [ ] [Link to test scenario]
 
-### Threat Model
-- Asset Identification
-- Threat Identification (STRIDE)
-- Vulnerability Assessment
-- Risk Rating
+#### FR-002: [Another Feature]
+**Priority**: Should Have  
+**Description**: The system shall [specific capability]
 
-### Security Controls
+**Acceptance Criteria**:
+- [ ] [Specific criterion]
+- [ ] [Another criterion]
 
-#### Network Security
-- Firewall rules
-- Network segmentation
-- DDoS protection
-- VPN requirements
+### Non-Functional Requirements
 
-#### Application Security
-- Input validation
-- Output encoding
-- Authentication mechanisms
-- Session management
-- Error handling
+#### NFR-001: Performance
+**Priority**: Must Have
 
-#### Data Security
-- Encryption at rest
-- Encryption in transit
-- Key management
-- Data classification
-- Data retention
+| Metric | Requirement | Degraded | Unacceptable |
+|--------|-------------|----------|--------------|
+| Response Time (95th percentile) | <200ms | 200-500ms | >500ms |
+| Throughput | 1000 req/sec | 500-1000 | <500 |
+| Concurrent Users | 5000 | 2500-5000 | <2500 |
 
-## Compliance Requirements
+#### NFR-002: Availability
+**Priority**: Must Have
+- Uptime: 99.9 percent (43.2 minutes downtime/month)
+- RTO: 15 minutes
+- RPO: 5 minutes
 
-### Regulatory Compliance
-- [ ] GDPR - General Data Protection Regulation
-- [ ] CCPA - California Consumer Privacy Act
-- [ ] HIPAA - Health Insurance Portability and Accountability Act
-- [ ] PCI DSS - Payment Card Industry Data Security Standard
-- [ ] SOX - Sarbanes-Oxley Act
+#### NFR-003: Security
+**Priority**: Must Have
+- Authentication: OAuth 2.0 / SAML 2.0
+- Authorization: Role-based (RBAC)
+- Encryption: TLS 1.3 in transit, AES-256 at rest
 
-### Security Standards
-- [ ] ISO 27001 - Information Security Management
-- [ ] NIST Cybersecurity Framework
-- [ ] CIS Controls
-- [ ] OWASP Top 10
+## System Architecture
 
-## Security Testing
+### High-Level Architecture
 
-### Testing Schedule
-- Static Application Security Testing (SAST): Every commit
-- Dynamic Application Security Testing (DAST): Weekly
-- Dependency Scanning: Daily
-- Penetration Testing: Annually
-- Security Code Review: Per release
+[ASCII diagram or description of system components and their relationships]
 
-### Security Metrics
-- Mean Time to Detect (MTTD)
-- Mean Time to Respond (MTTR)
-- Vulnerability density
-- Patch compliance rate
+### Technology Stack
 
----
-Created: {datetime.now().strftime('%Y-%m-%d')}
-"""
-        (project_dir / "requirements" / "security-requirements.md").write_text(security_content)
-        print("  ✓ Created: requirements/security-requirements.md")
-        
-        # Add SLA template
-        sla_content = f"""# Service Level Agreement - {self.args.project_name}
-
-## Service Levels
-
-### Availability SLA
-
-| Service Tier | Availability Target | Measurement Period | Allowed Downtime |
-|--------------|-------------------|-------------------|------------------|
-| Production | 99.9% | Monthly | 43.2 minutes |
-| Staging | 99.5% | Monthly | 3.6 hours |
-| Development | 95% | Monthly | 36 hours |
-
-### Performance SLA
-
-| Metric | Target | Measurement |
-|--------|--------|-------------|
-| API Response Time (p95) | <200ms | 5-minute average |
-| Page Load Time | <2 seconds | Real user monitoring |
-| Database Query Time | <50ms | Query logs |
-
-### Support SLA
-
-| Priority | Response Time | Resolution Time |
-|----------|--------------|-----------------|
-| Critical (P1) | 15 minutes | 4 hours |
-| High (P2) | 1 hour | 8 hours |
-| Medium (P3) | 4 hours | 2 business days |
-| Low (P4) | 1 business day | 5 business days |
-
-## Maintenance Windows
-
-- Scheduled: Sunday 2:00-4:00 AM UTC
-- Emergency: 4-hour advance notice
-- Patches: Zero-downtime deployment
-
-## Service Credits
-
-| Monthly Uptime | Service Credit |
-|----------------|----------------|
-| 99.5% - 99.9% | 10% |
-| 99.0% - 99.5% | 25% |
-| 95.0% - 99.0% | 50% |
-| < 95.0% | 100% |
-
----
-Created: {datetime.now().strftime('%Y-%m-%d')}
-"""
-        (project_dir / "requirements" / "sla.md").write_text(sla_content)
-        print("  ✓ Created: requirements/sla.md")
-    
-    def get_spec_template(self):
-        """Return the main SPEC.md template content."""
-        return f"""# {self.args.project_name} - Project Specification
-
-## Executive Summary
-
-[Provide a 2-3 paragraph overview of the project, covering:]
-- What problem this project solves
-- Who benefits and how
-- Expected business impact
-- High-level approach
-
-### Key Business Drivers
-- **Driver 1**: [Specific business need or opportunity]
-- **Driver 2**: [Market pressure or competitive advantage]
-- **Driver 3**: [Efficiency or cost consideration]
-
-### Success Criteria
-| Criterion | Target | Measurement |
-|-----------|--------|-------------|
-| [Business Metric] | [Specific Target] | [How Measured] |
-| [User Adoption] | [Target Percentage] | [Measurement Method] |
-| [Performance] | [Target Value] | [Measurement Tool] |
-
-## Stakeholders
-
-| Role | Name | Responsibilities | Approval Authority |
-|------|------|------------------|-------------------|
-| Executive Sponsor | [Name] | Strategic oversight, funding | Final go/no-go |
-| Product Owner | [Name] | Requirements, priorities | Feature approval |
-| Technical Lead | [Name] | Architecture, technical decisions | Technical approval |
-| QA Lead | [Name] | Quality standards, testing | Quality gates |
-| User Representative | [Name] | User needs, UAT | User acceptance |
-
-## Requirements
-
-### Functional Requirements
-
-#### FR-001: [Core Feature Name]
-**Priority**: Must Have  
-**Description**: The system shall [specific capability]
-
-**Acceptance Criteria**:
-- [ ] [Specific, measurable criterion]
-- [ ] [Another measurable criterion]
-- [ ] [Link to test scenario]
-
-#### FR-002: [Another Feature]
-**Priority**: Should Have  
-**Description**: The system shall [specific capability]
-
-**Acceptance Criteria**:
-- [ ] [Specific criterion]
-- [ ] [Another criterion]
-
-### Non-Functional Requirements
-
-#### NFR-001: Performance
-**Priority**: Must Have
-
-| Metric | Requirement | Degraded | Unacceptable |
-|--------|-------------|----------|--------------|
-| Response Time (95th percentile) | <200ms | 200-500ms | >500ms |
-| Throughput | 1000 req/sec | 500-1000 | <500 |
-| Concurrent Users | 5000 | 2500-5000 | <2500 |
-
-#### NFR-002: Availability
-**Priority**: Must Have
-- Uptime: 99.9 percent (43.2 minutes downtime/month)
-- RTO: 15 minutes
-- RPO: 5 minutes
-
-#### NFR-003: Security
-**Priority**: Must Have
-- Authentication: OAuth 2.0 / SAML 2.0
-- Authorization: Role-based (RBAC)
-- Encryption: TLS 1.3 in transit, AES-256 at rest
-
-## System Architecture
-
-### High-Level Architecture
-
-[ASCII diagram or description of system components and their relationships]
-
-### Technology Stack
-
-#### Frontend
-- **Framework**: [React/Vue/Angular] version X.X
-- **State Management**: [Redux/Vuex/etc]
-- **UI Components**: [Material/Ant/Custom]
-- **Build Tool**: [Webpack/Vite/etc]
+#### Frontend
+- **Framework**: [React/Vue/Angular] version X.X
+- **State Management**: [Redux/Vuex/etc]
+- **UI Components**: [Material/Ant/Custom]
+- **Build Tool**: [Webpack/Vite/etc]
 
 #### Backend
 - **Runtime**: [Node.js/Python/Java] version X.X
@@ -598,15 +260,13 @@ Created: {datetime.now().strftime('%Y-%m-%d')}
 
 | Version | Date | Author | Changes |
 |---------|------|--------|---------|
-| 1.0.0 | {datetime.now().strftime('%Y-%m-%d')} | [Your Name] | Initial specification |
+| 1.0.0 | {today} | [Your Name] | Initial specification |
 
 ---
-*This specification serves as the single source of truth for the {self.args.project_name} project.*
+*This specification serves as the single source of truth for the {project_name} project.*
 """
 
-    def get_outcome_template(self):
-        """Return the outcome definition template."""
-        return f"""# Outcome Definition - {self.args.project_name}
+_OUTCOME_BODY = """
 
 ## Business Outcomes
 
@@ -662,9 +322,7 @@ Created: {datetime.now().strftime('%Y-%m-%d')}
 *All implementation decisions should trace back to these outcomes.*
 """
 
-    def get_scenarios_template(self):
-        """Return the acceptance scenarios template."""
-        return f"""# Acceptance Scenarios - {self.args.project_name}
+_SCENARIOS_BODY = """
 
 ## Core User Scenarios
 
@@ -678,14 +336,14 @@ Created: {datetime.now().strftime('%Y-%m-%d')}
 
 **Test Data**:
 ```json
-{{
-  "input": {{
+{
+  "input": {
     "field1": "value1"
-  }},
-  "expected": {{
+  },
+  "expected": {
     "status": "success"
-  }}
-}}
+  }
+}
 ```
 
 **Acceptance Criteria**:
@@ -723,9 +381,7 @@ Created: {datetime.now().strftime('%Y-%m-%d')}
 *These scenarios form the basis for acceptance testing.*
 """
 
-    def get_nfr_template(self):
-        """Return the NFR template."""
-        return f"""# Non-Functional Requirements - {self.args.project_name}
+_NFR_BODY = """
 
 ## Performance Requirements
 
@@ -793,6 +449,617 @@ Created: {datetime.now().strftime('%Y-%m-%d')}
 *These NFRs must be testable and monitored in production.*
 """
 
+_BASIC_SPEC_TEMPLATE = """# {project_name} - Specification
+
+## Overview
+[Brief description of the project and its purpose]
+
+## Goals
+- Goal 1: [Specific, measurable goal]
+- Goal 2: [Another specific goal]
+- Goal 3: [Another goal]
+
+## Requirements
+
+### Must Have
+- [ ] [Critical requirement 1]
+- [ ] [Critical requirement 2]
+- [ ] [Critical requirement 3]
+
+### Should Have
+- [ ] [Important but not critical requirement]
+- [ ] [Another important requirement]
+
+### Nice to Have
+- [ ] [Optional enhancement]
+
+## Success Criteria
+- [How we know the project succeeded]
+- [Another success indicator]
+- [Measurable outcome]
+
+## Technical Approach
+[High-level description of the technical solution]
+
+## Risks
+| Risk | Impact | Probability | Mitigation |
+|------|--------|-------------|------------|
+| [Risk description] | High/Medium/Low | High/Medium/Low | [How to handle] |
+
+## Timeline
+- Phase 1: [What] - [Duration] - [Deliverable]
+- Phase 2: [What] - [Duration] - [Deliverable]
+
+---
+Created: {today}
+"""
+
+_SECURITY_TEMPLATE = """# Security Requirements - {project_name}
+
+## Security Architecture
+
+### Threat Model
+- Asset Identification
+- Threat Identification (STRIDE)
+- Vulnerability Assessment
+- Risk Rating
+
+### Security Controls
+
+#### Network Security
+- Firewall rules
+- Network segmentation
+- DDoS protection
+- VPN requirements
+
+#### Application Security
+- Input validation
+- Output encoding
+- Authentication mechanisms
+- Session management
+- Error handling
+
+#### Data Security
+- Encryption at rest
+- Encryption in transit
+- Key management
+- Data classification
+- Data retention
+
+## Compliance Requirements
+
+### Regulatory Compliance
+- [ ] GDPR - General Data Protection Regulation
+- [ ] CCPA - California Consumer Privacy Act
+- [ ] HIPAA - Health Insurance Portability and Accountability Act
+- [ ] PCI DSS - Payment Card Industry Data Security Standard
+- [ ] SOX - Sarbanes-Oxley Act
+
+### Security Standards
+- [ ] ISO 27001 - Information Security Management
+- [ ] NIST Cybersecurity Framework
+- [ ] CIS Controls
+- [ ] OWASP Top 10
+
+## Security Testing
+
+### Testing Schedule
+- Static Application Security Testing (SAST): Every commit
+- Dynamic Application Security Testing (DAST): Weekly
+- Dependency Scanning: Daily
+- Penetration Testing: Annually
+- Security Code Review: Per release
+
+### Security Metrics
+- Mean Time to Detect (MTTD)
+- Mean Time to Respond (MTTR)
+- Vulnerability density
+- Patch compliance rate
+
+---
+Created: {today}
+"""
+
+_SLA_TEMPLATE = """# Service Level Agreement - {project_name}
+
+## Service Levels
+
+### Availability SLA
+
+| Service Tier | Availability Target | Measurement Period | Allowed Downtime |
+|--------------|-------------------|-------------------|------------------|
+| Production | 99.9% | Monthly | 43.2 minutes |
+| Staging | 99.5% | Monthly | 3.6 hours |
+| Development | 95% | Monthly | 36 hours |
+
+### Performance SLA
+
+| Metric | Target | Measurement |
+|--------|--------|-------------|
+| API Response Time (p95) | <200ms | 5-minute average |
+| Page Load Time | <2 seconds | Real user monitoring |
+| Database Query Time | <50ms | Query logs |
+
+### Support SLA
+
+| Priority | Response Time | Resolution Time |
+|----------|--------------|-----------------|
+| Critical (P1) | 15 minutes | 4 hours |
+| High (P2) | 1 hour | 8 hours |
+| Medium (P3) | 4 hours | 2 business days |
+| Low (P4) | 1 business day | 5 business days |
+
+## Maintenance Windows
+
+- Scheduled: Sunday 2:00-4:00 AM UTC
+- Emergency: 4-hour advance notice
+- Patches: Zero-downtime deployment
+
+## Service Credits
+
+| Monthly Uptime | Service Credit |
+|----------------|----------------|
+| 99.5% - 99.9% | 10% |
+| 99.0% - 99.5% | 25% |
+| 95.0% - 99.0% | 50% |
+| < 95.0% | 100% |
+
+---
+Created: {today}
+"""
+
+# Fully static, so it is stored already encoded
+_GITIGNORE = b"""# Spec building artifacts
+*.log
+*.tmp
+.DS_Store
+
+# Validation reports
+*-report.json
+*-validation.json
+validation/*.json
+validation/*.html
+
+# Review artifacts
+review/*.md
+!review/README.md
+
+# Editor files
+.vscode/
+.idea/
+*.swp
+*.bak
+
+# Python
+__pycache__/
+*.pyc
+.pytest_cache/
+"""
+
+
+def _compile(template: str, body: str = "") -> tuple:
+    """
+    Split a str.format ``template`` (plus a verbatim ``body``) into UTF-8
+    literal segments and the placeholder names between them.
+    """
+    parts = []
+    for literal, field, _spec, _conversion in Formatter().parse(template):
+        if literal:
+            parts.append(literal.encode('utf-8'))
+        if field is not None:
+            parts.append(field)
+    if body:
+        parts.append(body.encode('utf-8'))
+    return tuple(parts)
+
+
+# Every template as literal bytes around its placeholders, so a render is one
+# join of constant segments and the encoded field values
+_README_PARTS = _compile(_README_TEMPLATE)
+_SPEC_PARTS = _compile(_SPEC_TEMPLATE)
+_OUTCOME_PARTS = _compile("# Outcome Definition - {project_name}", _OUTCOME_BODY)
+_SCENARIOS_PARTS = _compile("# Acceptance Scenarios - {project_name}", _SCENARIOS_BODY)
+_NFR_PARTS = _compile("# Non-Functional Requirements - {project_name}", _NFR_BODY)
+_BASIC_SPEC_PARTS = _compile(_BASIC_SPEC_TEMPLATE)
+_SECURITY_PARTS = _compile(_SECURITY_TEMPLATE)
+_SLA_PARTS = _compile(_SLA_TEMPLATE)
+
+# The str sources only exist to be compiled; drop them so each template is
+# held once, as the shared read-only segments above
+del (_README_TEMPLATE, _SPEC_TEMPLATE, _OUTCOME_BODY, _SCENARIOS_BODY,
+     _NFR_BODY, _BASIC_SPEC_TEMPLATE, _SECURITY_TEMPLATE, _SLA_TEMPLATE)
+
+
+@lru_cache(maxsize=128)
+def _render(parts: tuple, fields: tuple) -> bytes:
+    """
+    Join compiled template ``parts``, filling placeholders from ``fields``
+    ((name, UTF-8 value) pairs).
+    
+    Cached on the template and field values, so scaffolding the same project
+    again in one process reuses the encoded buffer.
+    """
+    values = dict(fields)
+    return b"".join(
+        part if isinstance(part, bytes) else values[part] for part in parts
+    )
+
+
+# ASCII capitals to lower case and spaces to dashes, for project slugs
+_SLUG_TABLE = str.maketrans(
+    {**{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)}, ' ': '-'}
+)
+
+# Closing summary, printed with a single format and write
+_DONE_MSG = """
+✅ Spec structure created successfully!
+
+📝 Next steps:
+  1. cd {project_dir}
+  2. Review README.md for guidance
+  3. Complete templates in requirements/ directory:
+     - outcome-definition.md (define success)
+     - acceptance-scenarios.md (test cases)
+     - non-functional-requirements.md (quality)
+  4. Fill out the main spec/SPEC.md
+  5. Run validation:
+     python3 -m automation.score-spec-quality spec/SPEC.md
+"""
+
+
+class _FSWriter:
+    """Writes the generated structure to the real filesystem."""
+    
+    # Progress verb for each directory and file handed to the writer
+    VERB = "✓ Created"
+    
+    def make_root(self, root: str) -> bool:
+        """Create ``root`` and any missing parents; False if it already exists."""
+        try:
+            os.makedirs(root)
+        except FileExistsError:
+            return False
+        return True
+        
+    def mkdirs(self, root: str, names) -> None:
+        """Create each leaf directory ``names`` below the existing ``root``."""
+        # No re-walk of the parents; on a --force re-run the leaves already
+        # exist and EEXIST is expected
+        for name in names:
+            try:
+                os.mkdir(os.path.join(root, name))
+            except FileExistsError:
+                pass
+                
+    def write(self, path: str, data: bytes) -> None:
+        # The content is already one encoded buffer, so skip the io stack
+        # and hand it straight to the file descriptor
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            # os.write may accept less than asked for; resume from a view
+            # instead of slicing copies of the remainder
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+            
+
+class _MemWriter:
+    """Collects the generated structure in memory (dry runs and tests)."""
+    
+    VERB = "Would create"
+    
+    def __init__(self):
+        self.dirs: list = []
+        self.files: dict = {}
+        
+    def make_root(self, root: str) -> bool:
+        self.dirs.append(root)
+        # Nothing is created, but a dry run still reports a clash
+        return not os.path.lexists(root)
+        
+    def mkdirs(self, root: str, names) -> None:
+        self.dirs.extend(os.path.join(root, name) for name in names)
+        
+    def write(self, path: str, data: bytes) -> None:
+        self.files[os.fspath(path)] = data
+        
+
+class SpecTemplateGenerator(SpecTool):
+    """Generate spec templates with best practices built in."""
+    
+    VERSION = "3.0.0"
+    DESCRIPTION = "Generate comprehensive spec templates for new projects"
+    
+    # Template sets available
+    TEMPLATES = MappingProxyType({
+        'basic': 'Minimal spec structure for simple projects',
+        'standard': 'Standard spec with all recommended sections (default)',
+        'comprehensive': 'Full enterprise spec with compliance sections'
+    })
+    
+    # Top-level directories of every generated spec, created in this order
+    DIRECTORIES = (
+        "spec",
+        "requirements",
+        "roadmap",
+        "phase-plans",
+        "review",
+        "validation",
+    )
+    
+    # Every file a template set may write, relative to the project directory
+    FILES = MappingProxyType({
+        "gitignore": (".gitignore",),
+        "readme": ("README.md",),
+        "spec": ("spec", "SPEC.md"),
+        "outcome": ("requirements", "outcome-definition.md"),
+        "scenarios": ("requirements", "acceptance-scenarios.md"),
+        "nfr": ("requirements", "non-functional-requirements.md"),
+        "security": ("requirements", "security-requirements.md"),
+        "sla": ("requirements", "sla.md"),
+    })
+    
+    def create_parser(self):
+        parser = super().create_parser()
+        parser.add_argument('project_name', nargs='?',
+                          help='Name of the project')
+        parser.add_argument('-o', '--output-dir', default='.',
+                          help='Output directory (default: current directory)')
+        parser.add_argument('-t', '--template', 
+                          choices=list(self.TEMPLATES.keys()),
+                          default='standard',
+                          help='Template set to use')
+        parser.add_argument('--list-templates', action='store_true',
+                          help='List available templates and exit')
+        parser.add_argument('--force', action='store_true',
+                          help='Overwrite existing directory')
+        parser.add_argument('--dry-run', action='store_true',
+                          help='Render everything in memory without writing files')
+        return parser
+        
+    def get_examples(self):
+        return """
+Examples:
+  # Create standard spec for "My API"
+  %(prog)s "My API"
+  
+  # Use comprehensive template in specific directory
+  %(prog)s "Enterprise System" -o ./specs -t comprehensive
+  
+  # Preview the files a template set would create
+  %(prog)s "My API" -t basic --dry-run
+  
+  # List available templates
+  %(prog)s --list-templates
+"""
+    
+    def __init__(self):
+        super().__init__()
+        # Progress messages, written to stdout in one go by flush_log()
+        self._log: list = []
+        
+    def _say(self, msg: str = ""):
+        """Queue one line of progress output."""
+        self._log.append(msg + "\n")
+        
+    def flush_log(self):
+        """Write all queued progress output with a single stdout write."""
+        if self._log:
+            sys.stdout.write("".join(self._log))
+            sys.stdout.flush()
+            self._log = []
+            
+    def execute(self) -> int:
+        try:
+            if self.args.list_templates:
+                return self.list_templates()
+            return self.generate()
+        finally:
+            self.flush_log()
+            
+    def generate(self) -> int:
+        """Validate the project name and create its spec structure."""
+        # Validate inputs
+        if self.args.project_name is None:
+            self._say("✗ A project name is required (or use --list-templates)")
+            return 1
+        project_slug = self.slugify(self.args.project_name)
+        if not self.is_valid_slug(project_slug):
+            self._say(f"✗ Invalid project name: {self.args.project_name!r}")
+            self._say("  The name must be non-blank and must not contain path separators")
+            return 1
+        project_dir = Path(self.args.output_dir) / project_slug
+        
+        # Creating the project directory doubles as the existence check
+        writer = _MemWriter() if self.args.dry_run else _FSWriter()
+        try:
+            created = writer.make_root(os.fspath(project_dir))
+        except OSError as e:
+            self._say(f"✗ Error creating structure: {e}")
+            return 1
+        if not created and not self.args.force:
+            self._say(f"✗ Directory already exists: {project_dir}")
+            self._say("  Use --force to overwrite")
+            return 1
+            
+        # Create structure
+        self._say(f"\n🚀 Creating {self.args.template} spec structure for: {self.args.project_name}")
+        self._say(f"📁 Location: {project_dir.absolute()}\n")
+        
+        try:
+            self.create_structure(project_dir, writer=writer, root_ready=True)
+            if self.args.dry_run:
+                self._say("\n✅ Dry run complete: nothing was written")
+                return 0
+                
+            self._log.append(_DONE_MSG.format(project_dir=project_dir))
+            
+            return 0
+            
+        except Exception as e:
+            self._say(f"\n✗ Error creating structure: {e}")
+            return 1
+        
+    @staticmethod
+    def slugify(name: str) -> str:
+        """Lower-case a project name and turn its spaces into dashes."""
+        if name.isascii():
+            # One translate pass instead of lower() plus replace()
+            return name.translate(_SLUG_TABLE)
+        # str.lower() also folds non-ASCII capitals, which the table does not
+        return name.lower().replace(' ', '-')
+        
+    @staticmethod
+    def is_valid_slug(slug: str) -> bool:
+        """Check a project slug names exactly one directory below the output dir."""
+        if not slug.strip('-') or slug in ('.', '..'):
+            return False
+        return not any(sep and sep in slug for sep in (os.sep, os.altsep, '/'))
+        
+    def list_templates(self) -> int:
+        self._log.append("\nAvailable template sets:\n\n" + "".join(
+            f"  {name}{' (default)' if name == 'standard' else ''}\n    {desc}\n\n"
+            for name, desc in self.TEMPLATES.items()
+        ))
+        return 0
+        
+    def create_structure(self, project_dir: Path, writer=None, root_ready: bool = False):
+        """
+        Create the project structure.
+        
+        ``writer`` receives every directory and file; it defaults to the real
+        filesystem, and a ``_MemWriter`` keeps the whole run in memory.
+        ``root_ready`` says the caller already made ``project_dir`` itself.
+        """
+        # Imported here so --help and --list-templates never load it
+        from datetime import date
+        
+        self.writer = writer if writer is not None else _FSWriter()
+        self.files = []
+        # Stamped into every template; one clock read keeps them consistent
+        self.today = date.today().isoformat()
+        # Placeholder values shared by every module-level template
+        self.fields = {
+            'project_name': self.args.project_name,
+            'dir_name': project_dir.name,
+            'today': self.today,
+            'template': self.args.template,
+        }
+        # Encoded once per run and shared by every _render() call
+        self.field_key = tuple(
+            (name, value.encode('utf-8')) for name, value in self.fields.items()
+        )
+        # Plain string paths from here on, each file's joined once and handed
+        # to the template-set methods
+        root = os.fspath(project_dir)
+        paths = SimpleNamespace(**{
+            key: os.path.join(root, *parts) for key, parts in self.FILES.items()
+        })
+        
+        if not root_ready:
+            self.writer.make_root(root)
+        self.writer.mkdirs(root, self.DIRECTORIES)
+        verb = self.writer.VERB
+        self._log.extend(f"  {verb}: {name}/\n" for name in self.DIRECTORIES)
+            
+        # Create files based on template type; looked up on the instance so
+        # subclass overrides of create_*_templates() are honoured
+        getattr(self, f"create_{self.args.template}_templates")(paths)
+            
+        # Always create these files
+        self.create_common_files(paths)
+        
+        self.write_files()
+        
+    def add_file(self, path: str, data: bytes, label: str):
+        """Queue already-encoded file content to be written by write_files()."""
+        self.files.append((path, data, label))
+        
+    def write_files(self):
+        """
+        Write every queued file, then report them in queue order.
+        
+        The files are independent, so the writes run on a thread pool and
+        overlap their I/O; the report lines are queued once all of them
+        have landed.
+        """
+        def write(entry):
+            path, data, label = entry
+            self.writer.write(path, data)
+            return label
+            
+        # One worker per file up to the core count; a lone file (or an
+        # in-memory writer) is cheaper to write inline than to hand off
+        workers = min(len(self.files), os.cpu_count() or 1)
+        if workers > 1 and isinstance(self.writer, _FSWriter):
+            # Deferred like datetime: only a real multi-file write needs it
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                labels = list(pool.map(write, self.files))
+        else:
+            labels = [write(entry) for entry in self.files]
+        self.files = []
+        verb = self.writer.VERB
+        self._log.extend(f"  {verb}: {label}\n" for label in labels)
+        
+    def create_common_files(self, paths: SimpleNamespace):
+        """Create files common to all templates."""
+        # Create .gitignore
+        self.add_file(paths.gitignore, _GITIGNORE, ".gitignore")
+        
+        # Create main README
+        self.add_file(paths.readme,
+                      _render(_README_PARTS, self.field_key), "README.md")
+        
+    def create_standard_templates(self, paths: SimpleNamespace):
+        """Create standard template files."""
+        # Create a simpler SPEC.md that won't have formatting issues
+        self.add_file(paths.spec, self.get_spec_template(), "spec/SPEC.md")
+        
+        # Create requirements templates
+        self.add_file(paths.outcome, self.get_outcome_template(), "requirements/outcome-definition.md")
+        
+        self.add_file(paths.scenarios, self.get_scenarios_template(), "requirements/acceptance-scenarios.md")
+        
+        self.add_file(paths.nfr, self.get_nfr_template(), "requirements/non-functional-requirements.md")
+        
+    def create_basic_templates(self, paths: SimpleNamespace):
+        """Create minimal templates for simple projects."""
+        self.add_file(paths.spec,
+                      _render(_BASIC_SPEC_PARTS, self.field_key), "spec/SPEC.md (basic)")
+        
+    def create_comprehensive_templates(self, paths: SimpleNamespace):
+        """Create enterprise-grade templates."""
+        # Start with standard templates
+        self.create_standard_templates(paths)
+        
+        # Add additional enterprise files
+        self.add_file(paths.security,
+                      _render(_SECURITY_PARTS, self.field_key),
+                      "requirements/security-requirements.md")
+        
+        # Add SLA template
+        self.add_file(paths.sla,
+                      _render(_SLA_PARTS, self.field_key), "requirements/sla.md")
+    
+    def get_spec_template(self) -> bytes:
+        """Return the main SPEC.md template content, encoded."""
+        return _render(_SPEC_PARTS, self.field_key)
+
+    def get_outcome_template(self) -> bytes:
+        """Return the outcome definition template, encoded."""
+        return _render(_OUTCOME_PARTS, self.field_key)
+
+    def get_scenarios_template(self) -> bytes:
+        """Return the acceptance scenarios template, encoded."""
+        return _render(_SCENARIOS_PARTS, self.field_key)
+
+    def get_nfr_template(self) -> bytes:
+        """Return the NFR template, encoded."""
+        return _render(_NFR_PARTS, self.field_key)
+
 def main():
     tool = SpecTemplateGenerator()
     sys.exit(tool.run())
@@ -4,16 +4,63 @@ Suggest Spec Improvements
 Analyzes a spec and provides specific, actionable improvement suggestions.
 """
 
+import mmap
 import os
 import sys
 import re
+from bisect import bisect_left
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# Patterns are compiled once at import, with their flags baked in.
+# The vague-term and vague-timeline checks share one scan of the content:
+# each kind is a named alternative and analyze() buckets matches by name.
+# No alternative can overlap another, so this finds exactly what separate
+# scans would.
+_VAGUE_RE = re.compile(
+    r'(?P<term>\b(?:fast|slow|quick|good|bad|many|few|some)\b)'
+    r'|(?P<improvement>\b(?:improve|enhance|optimize)\b(?!.*\d+%))'
+    r'|(?P<level>\b(?:high|low|medium)\s+(?:performance|availability|quality)\b(?!.*\d+))'
+    r'|(?P<timeline>\b(?:soon|later|eventually|future)\b)',
+    re.IGNORECASE
+)
+# Vague-term kinds in reporting order, with their suggestion templates
+_VAGUE_SUGGESTIONS = (
+    ("term", "Replace vague term '{0}' with specific metric"),
+    ("improvement", "Quantify improvement - add specific percentage or metric"),
+    ("level", "Define what '{0}' means with specific thresholds")
+)
+_VAGUE_EXAMPLE = "Instead of 'fast response', use 'response time <200ms'"
+_REQ_RE = re.compile(r'^#{3,4}\s+(FR|NFR)-(\d+)[:\s]+(.+?)(?=^#{1,4}|\Z)', re.MULTILINE | re.DOTALL)
+_MEASURE_RE = re.compile(r'\d+\s*(ms|s|%|MB|GB|users?)')
+_ARCH_HEADER_RE = re.compile(r'#{1,2}\s+System Architecture')
+_DIAGRAM_RE = re.compile(r'```(?:mermaid|diagram|ascii)')
+_RISK_HEADER_RE = re.compile(r'#{1,2}\s+Risk')
+_TABLE_ROW_RE = re.compile(r'\|[^|]+\|[^|]+\|[^|]+\|[^|]+\|')
+_METRICS_HEADER_RE = re.compile(r'#{1,2}\s+Success Metrics')
+# Where a section body ends: the next line opening with '#'
+_SECTION_END_RE = re.compile(r'^#', re.MULTILINE)
+_NEWLINE_RE = re.compile(r'\n')
+
+# Priority buckets in report order: key, Markdown heading, console banner
+# and blurb, whether the console shows the line number, and the example
+# length the console shows examples below (None: always, 0: never)
+_PRIORITIES = (
+    ("high_priority", "High Priority", "🔴 HIGH PRIORITY",
+     "These significantly impact spec quality and should be addressed first:", True, None),
+    ("medium_priority", "Medium Priority", "🟡 MEDIUM PRIORITY",
+     "These improve clarity and completeness:", False, 100),
+    ("low_priority", "Low Priority", "🟢 LOW PRIORITY",
+     "Nice to have improvements:", False, 0)
+)
 
 class ImprovementAnalyzer:
     def __init__(self, spec_path: str):
         self.spec_path = Path(spec_path)
         self.content = ""
+        self._nl_offsets: List[int] = []
+        self._content_lower = ""
+        self._vague_matches: Dict[str, List[re.Match]] = {}
         self.suggestions = {
             "high_priority": [],
             "medium_priority": [],
@@ -24,8 +71,15 @@ class ImprovementAnalyzer:
         """Run improvement analysis"""
         print(f"🔍 Analyzing spec for improvements: {self.spec_path}")
         
-        with open(self.spec_path, 'r') as f:
-            self.content = f.read()
+        self.content = self._read_spec()
+        # Newline offsets, so a match position maps to its line by bisection
+        self._nl_offsets = [m.start() for m in _NEWLINE_RE.finditer(self.content)]
+        # Lowered once for every case-insensitive substring check
+        self._content_lower = self.content.lower()
+        # One pass for every vague-wording check
+        self._vague_matches = {name: [] for name in _VAGUE_RE.groupindex}
+        for match in _VAGUE_RE.finditer(self.content):
+            self._vague_matches[match.lastgroup].append(match)
             
         # Run various checks
         self._check_quantification()
@@ -40,28 +94,57 @@ class ImprovementAnalyzer:
         # Generate report
         self._generate_report()
         
+    def _read_spec(self) -> str:
+        """Decode the spec straight from a read-only mapping of the file"""
+        # No intermediate bytes copy: str() decodes from the mapped pages
+        with open(self.spec_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8')
+        if '\r' in content:
+            # Same newline handling as reading in text mode
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+        
+    def _line_of(self, offset: int) -> int:
+        """1-based line number of a character offset in the content"""
+        return bisect_left(self._nl_offsets, offset) + 1
+        
+    def _find_section(self, header_re: re.Pattern) -> Optional[Tuple[int, str]]:
+        """
+        Find the first section whose header matches, returning the header
+        offset and the body up to the next line starting with '#'.
+        
+        Slicing by offset replaces a lazy DOTALL body capture that tried
+        the end-of-section lookahead at every character.
+        """
+        header = header_re.search(self.content)
+        # The body is at least one character long
+        if not header or header.end() == len(self.content):
+            return None
+        end = _SECTION_END_RE.search(self.content, header.end() + 1)
+        body_end = end.start() if end else len(self.content)
+        return header.start(), self.content[header.end():body_end]
+        
     def _check_quantification(self):
         """Check for vague vs quantified statements"""
         print("\n📊 Checking quantification...")
         
-        vague_patterns = [
-            (r'\b(fast|slow|quick|good|bad|many|few|some)\b', 
-             "Replace vague term '{0}' with specific metric"),
-            (r'\b(improve|enhance|optimize)\b(?!.*\d+%)',
-             "Quantify improvement - add specific percentage or metric"),
-            (r'\b(high|low|medium)\s+(performance|availability|quality)\b(?!.*\d+)',
-             "Define what '{0}' means with specific thresholds")
-        ]
-        
-        for pattern, suggestion in vague_patterns:
-            matches = re.finditer(pattern, self.content, re.IGNORECASE)
-            for match in matches:
-                line_num = self.content[:match.start()].count('\n') + 1
+        # The same term tends to recur, so its issue and suggestion text is
+        # formatted once and shared by every entry that reports it
+        texts: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for kind, suggestion in _VAGUE_SUGGESTIONS:
+            for match in self._vague_matches[kind]:
+                term = match.group(0)
+                if (kind, term) not in texts:
+                    texts[kind, term] = (f"Vague term: '{term}'", suggestion.format(term))
+                issue, text = texts[kind, term]
                 self.suggestions["high_priority"].append({
-                    "line": line_num,
-                    "issue": f"Vague term: '{match.group(0)}'",
-                    "suggestion": suggestion.format(match.group(0)),
-                    "example": "Instead of 'fast response', use 'response time <200ms'"
+                    "line": self._line_of(match.start()),
+                    "issue": issue,
+                    "suggestion": text,
+                    "example": _VAGUE_EXAMPLE
                 })
                 
     def _check_testability(self):
@@ -69,16 +152,15 @@ class ImprovementAnalyzer:
         print("\n🧪 Checking testability...")
         
         # Find requirements without clear acceptance criteria
-        req_pattern = r'^#{3,4}\s+(FR|NFR)-\d+[:\s]+(.+?)(?=^#{1,4}|\Z)'
-        requirements = re.finditer(req_pattern, self.content, re.MULTILINE | re.DOTALL)
+        requirements = _REQ_RE.finditer(self.content)
         
         for req in requirements:
-            req_text = req.group(2)
-            req_id = req.group(1) + "-" + req.group(0).split('-')[1].split(':')[0]
+            req_id = f"{req.group(1)}-{req.group(2)}"
+            req_text = req.group(3)
             
             # Check for measurable criteria
-            if not re.search(r'\d+\s*(ms|s|%|MB|GB|users?)', req_text):
-                line_num = self.content[:req.start()].count('\n') + 1
+            if not _MEASURE_RE.search(req_text):
+                line_num = self._line_of(req.start())
                 self.suggestions["high_priority"].append({
                     "line": line_num,
                     "issue": f"Requirement {req_id} lacks measurable criteria",
@@ -91,13 +173,14 @@ class ImprovementAnalyzer:
         print("\n🎨 Checking visual aids...")
         
         # Check architecture section
-        arch_section = re.search(r'#{1,2}\s+System Architecture(.+?)(?=^#{1,2}|\Z)', 
-                                self.content, re.MULTILINE | re.DOTALL)
+        # The literal header must be present; skip the DOTALL search if not
+        arch_section = ("System Architecture" in self.content
+                        and self._find_section(_ARCH_HEADER_RE))
         
         if arch_section:
-            arch_content = arch_section.group(1)
-            if not re.search(r'```(?:mermaid|diagram|ascii)', arch_content):
-                line_num = self.content[:arch_section.start()].count('\n') + 1
+            arch_start, arch_content = arch_section
+            if not _DIAGRAM_RE.search(arch_content):
+                line_num = self._line_of(arch_start)
                 self.suggestions["medium_priority"].append({
                     "line": line_num,
                     "issue": "Architecture section lacks diagrams",
@@ -112,7 +195,8 @@ graph TD
                 })
                 
         # Check for data flow diagrams
-        if "data flow" in self.content.lower() and "```" not in self.content[max(0, self.content.lower().find("data flow")-100):self.content.lower().find("data flow")+100]:
+        idx = self._content_lower.find("data flow")
+        if idx != -1 and "```" not in self.content[max(0, idx-100):idx+100]:
             self.suggestions["medium_priority"].append({
                 "line": 0,
                 "issue": "Data flow mentioned but not visualized",
@@ -140,13 +224,13 @@ graph TD
         """Check risk analysis completeness"""
         print("\n⚠️  Checking risk coverage...")
         
-        risk_section = re.search(r'#{1,2}\s+Risk(.+?)(?=^#{1,2}|\Z)', 
-                                self.content, re.MULTILINE | re.DOTALL)
+        risk_section = "Risk" in self.content and self._find_section(_RISK_HEADER_RE)
         
         if risk_section:
-            risks = len(re.findall(r'\|[^|]+\|[^|]+\|[^|]+\|[^|]+\|', risk_section.group(1)))
+            risk_start, risk_content = risk_section
+            risks = len(_TABLE_ROW_RE.findall(risk_content))
             if risks < 5:
-                line_num = self.content[:risk_section.start()].count('\n') + 1
+                line_num = self._line_of(risk_start)
                 self.suggestions["medium_priority"].append({
                     "line": line_num,
                     "issue": f"Only {risks} risks identified",
@@ -163,7 +247,7 @@ graph TD
         print("\n🏗️  Checking architecture detail...")
         
         # Check for deployment architecture
-        if "deploy" not in self.content.lower():
+        if "deploy" not in self._content_lower:
             self.suggestions["medium_priority"].append({
                 "line": 0,
                 "issue": "No deployment architecture described",
@@ -181,7 +265,7 @@ graph TD
         print("\n📅 Checking timeline detail...")
         
         # Look for vague timeline terms
-        vague_timeline = re.findall(r'\b(soon|later|eventually|future)\b', self.content, re.IGNORECASE)
+        vague_timeline = [match.group(0) for match in self._vague_matches["timeline"]]
         if vague_timeline:
             self.suggestions["high_priority"].append({
                 "line": 0,
@@ -194,15 +278,15 @@ graph TD
         """Check success metrics completeness"""
         print("\n📈 Checking success metrics...")
         
-        metrics_section = re.search(r'#{1,2}\s+Success Metrics(.+?)(?=^#{1,2}|\Z)', 
-                                   self.content, re.MULTILINE | re.DOTALL)
+        metrics_section = ("Success Metrics" in self.content
+                           and self._find_section(_METRICS_HEADER_RE))
         
         if metrics_section:
-            metrics_content = metrics_section.group(1)
+            metrics_start, metrics_content = metrics_section
             
             # Check for baseline data
             if "current" not in metrics_content.lower():
-                line_num = self.content[:metrics_section.start()].count('\n') + 1
+                line_num = self._line_of(metrics_start)
                 self.suggestions["high_priority"].append({
                     "line": line_num,
                     "issue": "Success metrics lack baseline data",
@@ -212,69 +296,54 @@ graph TD
                 
     def _generate_report(self):
         """Generate improvement report"""
-        print("\n" + "="*60)
-        print("SPEC IMPROVEMENT SUGGESTIONS")
-        print("="*60)
+        # Console lines and the Markdown body are each collected, then
+        # written in one go
+        out = []
+        out.append("\n" + "="*60)
+        out.append("SPEC IMPROVEMENT SUGGESTIONS")
+        out.append("="*60)
         
-        total_suggestions = sum(len(self.suggestions[p]) for p in self.suggestions)
-        print(f"\n📊 Found {total_suggestions} improvement opportunities")
+        total_suggestions = sum(len(items) for items in self.suggestions.values())
+        out.append(f"\n📊 Found {total_suggestions} improvement opportunities")
         
-        # High priority
-        if self.suggestions["high_priority"]:
-            print(f"\n🔴 HIGH PRIORITY ({len(self.suggestions['high_priority'])} items)")
-            print("These significantly impact spec quality and should be addressed first:\n")
-            
-            for i, suggestion in enumerate(self.suggestions["high_priority"], 1):
-                print(f"{i}. Line {suggestion['line']}: {suggestion['issue']}")
-                print(f"   📝 {suggestion['suggestion']}")
-                print(f"   💡 Example: {suggestion['example']}")
-                print()
-                
-        # Medium priority
-        if self.suggestions["medium_priority"]:
-            print(f"\n🟡 MEDIUM PRIORITY ({len(self.suggestions['medium_priority'])} items)")
-            print("These improve clarity and completeness:\n")
-            
-            for i, suggestion in enumerate(self.suggestions["medium_priority"], 1):
-                print(f"{i}. {suggestion['issue']}")
-                print(f"   📝 {suggestion['suggestion']}")
-                if len(suggestion['example']) < 100:
-                    print(f"   💡 Example: {suggestion['example']}")
-                print()
-                
-        # Low priority  
-        if self.suggestions["low_priority"]:
-            print(f"\n🟢 LOW PRIORITY ({len(self.suggestions['low_priority'])} items)")
-            print("Nice to have improvements:\n")
+        # One ordered pass over the buckets fills both outputs
+        report_path = self.spec_path.parent / "improvement-suggestions.md"
+        body = ["# Spec Improvement Suggestions\n\n",
+                f"Generated for: {self.spec_path.name}\n\n"]
+        for key, title, banner, blurb, show_line, example_max in _PRIORITIES:
+            items = self.suggestions[key]
+            if not items:
+                continue
+            out.append(f"\n{banner} ({len(items)} items)")
+            out.append(blurb + "\n")
+            body.append(f"## {title}\n\n")
             
-            for i, suggestion in enumerate(self.suggestions["low_priority"], 1):
-                print(f"{i}. {suggestion['issue']}")
-                print(f"   📝 {suggestion['suggestion']}")
-                print()
+            for i, suggestion in enumerate(items, 1):
+                where = f"Line {suggestion['line']}: " if show_line else ""
+                out.append(f"{i}. {where}{suggestion['issue']}")
+                out.append(f"   📝 {suggestion['suggestion']}")
+                if example_max is None or len(suggestion['example']) < example_max:
+                    out.append(f"   💡 Example: {suggestion['example']}")
+                out.append("")
+                body.append(f"- **Issue**: {suggestion['issue']}\n"
+                            f"  - **Suggestion**: {suggestion['suggestion']}\n"
+                            f"  - **Example**: {suggestion['example']}\n\n")
                 
         # Quick wins
-        print("\n⚡ QUICK WINS (< 30 minutes to implement):")
-        print("1. Add specific metrics to all vague terms")
-        print("2. Include acceptance criteria for each requirement")
-        print("3. Add timeline with specific milestones")
-        print("4. Quantify all improvement goals with percentages")
+        out.append("\n⚡ QUICK WINS (< 30 minutes to implement):")
+        out.append("1. Add specific metrics to all vague terms")
+        out.append("2. Include acceptance criteria for each requirement")
+        out.append("3. Add timeline with specific milestones")
+        out.append("4. Quantify all improvement goals with percentages")
         
         # Save detailed report
-        report_path = self.spec_path.parent / "improvement-suggestions.md"
-        with open(report_path, 'w') as f:
-            f.write(f"# Spec Improvement Suggestions\n\n")
-            f.write(f"Generated for: {self.spec_path.name}\n\n")
-            
-            for priority in ["high_priority", "medium_priority", "low_priority"]:
-                if self.suggestions[priority]:
-                    f.write(f"## {priority.replace('_', ' ').title()}\n\n")
-                    for s in self.suggestions[priority]:
-                        f.write(f"- **Issue**: {s['issue']}\n")
-                        f.write(f"  - **Suggestion**: {s['suggestion']}\n")
-                        f.write(f"  - **Example**: {s['example']}\n\n")
+        with open(report_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write("".join(body))
                         
-        print(f"\n📄 Detailed suggestions saved to: {report_path}")
-        print("="*60)
+        out.append(f"\n📄 Detailed suggestions saved to: {report_path}")
+        out.append("="*60)
+        out.append("")
+        sys.stdout.write("\n".join(out))
 
 def main():
     """Main entry point"""
@@ -14,6 +14,8 @@ Use this before major reviews or as a CI/CD gate.
 
 import sys
 import subprocess
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Dict
 import json
@@ -61,6 +63,17 @@ class SpecValidationSuite(SpecTool):
         }
     ]
     
+    # Validator name -> its --skip choice
+    SKIP_NAMES = {
+        'Structure Validation': 'structure',
+        'Quality Scoring': 'quality',
+        'Link Validation': 'links',
+        'Requirements Traceability': 'traceability'
+    }
+    
+    # Summary status text, keyed on a result's success flag
+    STATUS_TEXT = {True: "✅ PASS", False: "❌ FAIL"}
+    
     def create_parser(self):
         parser = super().create_parser()
         parser.add_argument('spec_path',
@@ -103,13 +116,27 @@ Examples:
         
         results = []
         overall_success = True
+        validators = [v for v in self.VALIDATORS if not self._should_skip(v['name'])]
+        
+        # Each validator is an independent subprocess, so they run side by
+        # side and are reported in order. --stop-on-error keeps them
+        # sequential so nothing past the first critical failure is started.
+        concurrent = not self.args.stop_on_error and len(validators) >= 2
+        if concurrent:
+            if not self.args.quiet:
+                names = ", ".join(v['name'] for v in validators)
+                print(f"\n▶️  Running {len(validators)} validators in parallel: {names}...",
+                      flush=True)
+            with ThreadPoolExecutor(max_workers=len(validators)) as pool:
+                outcomes = list(pool.map(lambda v: self._spawn(v, spec_path), validators))
+        else:
+            outcomes = self._run_sequential(validators, spec_path)
         
-        # Run each validator
-        for validator in self.VALIDATORS:
-            if self._should_skip(validator['name']):
-                continue
-                
-            result = self._run_validator(validator, spec_path)
+        for validator, (result, outcome) in zip(validators, outcomes):
+            if concurrent and not self.args.quiet:
+                print(f"\n⏹️  {validator['name']} finished")
+                print("-" * 40)
+            self._report_validator(validator, result, outcome)
             results.append(result)
             
             if not result['success'] and validator['critical']:
@@ -134,22 +161,22 @@ Examples:
         """Check if validator should be skipped."""
         if not self.args.skip:
             return False
-            
-        skip_map = {
-            'Structure Validation': 'structure',
-            'Quality Scoring': 'quality',
-            'Link Validation': 'links',
-            'Requirements Traceability': 'traceability'
-        }
-        
-        return skip_map.get(validator_name, '') in self.args.skip
+        return self.SKIP_NAMES.get(validator_name, '') in self.args.skip
     
-    def _run_validator(self, validator: Dict, spec_path: Path) -> Dict:
-        """Run a single validator."""
-        if not self.args.quiet:
-            print(f"\n▶️  Running {validator['name']}...")
-            print("-" * 40)
-        
+    def _run_sequential(self, validators: List[Dict], spec_path: Path):
+        """Run validators one at a time, announcing each as it starts."""
+        for validator in validators:
+            if not self.args.quiet:
+                print(f"\n▶️  Running {validator['name']}...")
+                print("-" * 40, flush=True)
+            yield self._spawn(validator, spec_path)
+    
+    def _spawn(self, validator: Dict, spec_path: Path) -> Tuple[Dict, str]:
+        """
+        Run a single validator and return its result with how it ended:
+        'ran', 'timeout' or 'error'. Prints nothing, so it is safe to call
+        from worker threads.
+        """
         # Build command
         script_path = Path(__file__).parent / validator['script']
         cmd = [sys.executable, str(script_path), str(spec_path)] + validator['args']
@@ -162,30 +189,16 @@ Examples:
                 text=True,
                 timeout=30
             )
-            
-            success = result.returncode == 0
-            
-            if not self.args.quiet:
-                if success:
-                    print("✅ PASSED")
-                else:
-                    print("❌ FAILED")
-                    if result.stdout:
-                        print(result.stdout)
-                    if result.stderr:
-                        print(f"Error: {result.stderr}")
-            
             return {
                 'name': validator['name'],
-                'success': success,
+                'success': result.returncode == 0,
                 'critical': validator['critical'],
                 'output': result.stdout,
                 'error': result.stderr,
                 'return_code': result.returncode
-            }
+            }, 'ran'
             
         except subprocess.TimeoutExpired:
-            print("⏱️  TIMEOUT")
             return {
                 'name': validator['name'],
                 'success': False,
@@ -193,9 +206,8 @@ Examples:
                 'output': '',
                 'error': 'Validation timed out',
                 'return_code': -1
-            }
+            }, 'timeout'
         except Exception as e:
-            print(f"💥 ERROR: {e}")
             return {
                 'name': validator['name'],
                 'success': False,
@@ -203,34 +215,52 @@ Examples:
                 'output': '',
                 'error': str(e),
                 'return_code': -1
-            }
+            }, 'error'
+    
+    def _report_validator(self, validator: Dict, result: Dict, outcome: str):
+        """Print the outcome of one finished validator."""
+        if outcome == 'timeout':
+            print("⏱️  TIMEOUT")
+        elif outcome == 'error':
+            print(f"💥 ERROR: {result['error']}")
+        elif not self.args.quiet:
+            if result['success']:
+                print("✅ PASSED")
+            else:
+                print("❌ FAILED")
+                if result['output']:
+                    print(result['output'])
+                if result['error']:
+                    print(f"Error: {result['error']}")
     
     def _show_summary(self, results: List[Dict], overall_success: bool):
         """Show validation summary."""
-        print("\n" + "=" * 60)
-        print("VALIDATION SUMMARY")
-        print("=" * 60)
+        out = ["\n" + "=" * 60, "VALIDATION SUMMARY", "=" * 60]
         
         passed = sum(1 for r in results if r['success'])
         total = len(results)
         
-        print(f"\nValidations run: {total}")
-        print(f"Passed: {passed}")
-        print(f"Failed: {total - passed}")
+        out.append(f"\nValidations run: {total}")
+        out.append(f"Passed: {passed}")
+        out.append(f"Failed: {total - passed}")
         
         if results:
-            print("\nDetails:")
+            out.append("\nDetails:")
             for result in results:
-                status = "✅ PASS" if result['success'] else "❌ FAIL"
+                status = self.STATUS_TEXT[result['success']]
                 critical = " (critical)" if result['critical'] and not result['success'] else ""
-                print(f"  - {result['name']}: {status}{critical}")
+                out.append(f"  - {result['name']}: {status}{critical}")
         
-        print("\n" + "=" * 60)
+        out.append("\n" + "=" * 60)
         
         if overall_success:
-            print("\n🎉 All validations PASSED! Spec is ready for review.")
+            out.append("\n🎉 All validations PASSED! Spec is ready for review.")
         else:
-            print("\n❌ Validation FAILED. Please address the issues above.")
+            out.append("\n❌ Validation FAILED. Please address the issues above.")
+        
+        # One write for the whole block
+        out.append("")
+        sys.stdout.write("\n".join(out))
     
     def _save_report(self, results: List[Dict], spec_path: Path):
         """Save validation report to file."""
@@ -242,7 +272,7 @@ Examples:
         }
         
         report_path = Path(self.args.report)
-        with open(report_path, 'w') as f:
+        with open(report_path, 'w', encoding='utf-8', newline='\n') as f:
             json.dump(report, f, indent=2)
         
         print(f"\n📄 Validation report saved to: {report_path}")
@@ -254,8 +284,15 @@ Examples:
         
         script_path = Path(__file__).parent / 'improvement' / 'suggest-spec-improvements.py'
         if script_path.exists():
-            cmd = [sys.executable, str(script_path), str(spec_path)]
-            subprocess.run(cmd)
+            # Load the analyzer in-process rather than starting another
+            # interpreter just to run it; failures are reported, not fatal.
+            module_spec = importlib.util.spec_from_file_location('suggest_spec_improvements', script_path)
+            module = importlib.util.module_from_spec(module_spec)
+            try:
+                module_spec.loader.exec_module(module)
+                module.ImprovementAnalyzer(str(spec_path)).analyze()
+            except Exception as e:
+                print(f"💥 ERROR: {e}")
 
 def main():
     tool = SpecValidationSuite()
@@ -466,7 +466,7 @@ Examples:
         report_dict = asdict(report)
         
         if self.args.output_file:
-            with open(self.args.output_file, 'w') as f:
+            with open(self.args.output_file, 'w', encoding='utf-8', newline='\n') as f:
                 json.dump(report_dict, f, indent=2)
         else:
             print(json.dumps(report_dict, indent=2))
@@ -506,19 +506,19 @@ Examples:
 """
         
         if self.args.output_file:
-            with open(self.args.output_file, 'w') as f:
+            with open(self.args.output_file, 'w', encoding='utf-8', newline='\n') as f:
                 f.write(md)
         else:
             print(md)
     
     def _save_json_report(self, report: QualityReport, path: Path):
         """Save report as JSON."""
-        with open(path, 'w') as f:
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
             json.dump(asdict(report), f, indent=2)
     
     def _save_text_report(self, report: QualityReport, path: Path, percentage: float):
         """Save report as text."""
-        with open(path, 'w') as f:
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
             f.write(f"SPEC QUALITY REPORT\n")
             f.write(f"{'=' * 50}\n\n")
             f.write(f"File: {report.spec_path}\n")
@@ -318,7 +318,7 @@ class AlignmentValidator:
             }
         }
         
-        with open(report_path, 'w') as f:
+        with open(report_path, 'w', encoding='utf-8', newline='\n') as f:
             json.dump(report_data, f, indent=2)
             
         print(f"\n📄 Detailed report saved to: {report_path}")
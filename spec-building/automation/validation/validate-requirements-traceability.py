@@ -11,6 +11,12 @@ from pathlib import Path
 from typing import Dict, List, Set, Tuple
 import json
 
+# Requirement headers and the sections traces are looked for in
+_FR_RE = re.compile(r'^#{3,4}\s+(FR-\d+)[:\s]+(.+?)(?=^#{1,4}|\Z)', re.MULTILINE | re.DOTALL)
+_NFR_RE = re.compile(r'^#{3,4}\s+(NFR-\d+)[:\s]+(.+?)(?=^#{1,4}|\Z)', re.MULTILINE | re.DOTALL)
+_ARCH_SECTION_RE = re.compile(r'#{1,2}\s+System Architecture(.+?)(?=^#{1,2}|\Z)', re.MULTILINE | re.DOTALL)
+_RISK_SECTION_RE = re.compile(r'#{1,2}\s+Risk(.+?)(?=^#{1,2}|\Z)', re.MULTILINE | re.DOTALL)
+
 class TraceabilityValidator:
     def __init__(self, spec_path: str):
         self.spec_path = Path(spec_path)
@@ -26,11 +32,16 @@ class TraceabilityValidator:
         }
         self.errors = []
         self.warnings = []
+        self.content = ""
         
     def validate(self) -> bool:
         """Run traceability validation"""
         print(f"🔍 Validating requirements traceability in: {self.spec_path}")
         
+        # Read the spec once; every trace pass below searches this copy
+        with open(self.spec_path, 'r') as f:
+            self.content = f.read()
+        
         # Extract requirements
         self._extract_requirements()
         
@@ -49,12 +60,10 @@ class TraceabilityValidator:
         """Extract all requirements from spec"""
         print("\n📋 Extracting requirements...")
         
-        with open(self.spec_path, 'r') as f:
-            content = f.read()
-            
+        content = self.content
+        
         # Extract functional requirements
-        fr_pattern = r'^#{3,4}\s+(FR-\d+)[:\s]+(.+?)(?=^#{1,4}|\Z)'
-        for match in re.finditer(fr_pattern, content, re.MULTILINE | re.DOTALL):
+        for match in _FR_RE.finditer(content):
             req_id = match.group(1)
             req_text = match.group(2).strip()
             self.requirements["functional"][req_id] = {
@@ -63,8 +72,7 @@ class TraceabilityValidator:
             }
             
         # Extract non-functional requirements
-        nfr_pattern = r'^#{3,4}\s+(NFR-\d+)[:\s]+(.+?)(?=^#{1,4}|\Z)'
-        for match in re.finditer(nfr_pattern, content, re.MULTILINE | re.DOTALL):
+        for match in _NFR_RE.finditer(content):
             req_id = match.group(1)
             req_text = match.group(2).strip()
             self.requirements["non_functional"][req_id] = {
@@ -80,12 +88,10 @@ class TraceabilityValidator:
         """Find traces from requirements to architecture"""
         print("\n🏗️  Finding architecture traces...")
         
-        with open(self.spec_path, 'r') as f:
-            content = f.read()
-            
+        content = self.content
+        
         # Look for requirement references in architecture section
-        arch_section = re.search(r'#{1,2}\s+System Architecture(.+?)(?=^#{1,2}|\Z)', 
-                                content, re.MULTILINE | re.DOTALL)
+        arch_section = _ARCH_SECTION_RE.search(content)
         
         if arch_section:
             arch_content = arch_section.group(1)
@@ -102,18 +108,13 @@ class TraceabilityValidator:
         """Find traces from requirements to acceptance scenarios"""
         print("\n🧪 Finding acceptance scenario traces...")
         
-        # Check main spec
-        with open(self.spec_path, 'r') as f:
-            content = f.read()
-            
-        # Also check for acceptance scenarios file
+        # Main spec, plus any acceptance scenarios files next to it
         acceptance_files = [
-            self.spec_path,
             self.spec_dir / ".spec" / "acceptance-scenarios.md",
             self.spec_dir / "requirements" / "acceptance-scenarios.md"
         ]
         
-        all_content = ""
+        all_content = self.content + "\n"
         for file_path in acceptance_files:
             if file_path.exists():
                 with open(file_path, 'r') as f:
@@ -130,12 +131,10 @@ class TraceabilityValidator:
         """Find traces from requirements to risks"""
         print("\n⚠️  Finding risk traces...")
         
-        with open(self.spec_path, 'r') as f:
-            content = f.read()
-            
+        content = self.content
+        
         # Look for requirement references in risks section
-        risk_section = re.search(r'#{1,2}\s+Risk(.+?)(?=^#{1,2}|\Z)', 
-                               content, re.MULTILINE | re.DOTALL)
+        risk_section = _RISK_SECTION_RE.search(content)
         
         if risk_section:
             risk_content = risk_section.group(1)
@@ -232,7 +231,7 @@ class TraceabilityValidator:
             }
         }
         
-        with open(report_path, 'w') as f:
+        with open(report_path, 'w', encoding='utf-8', newline='\n') as f:
             json.dump(report_data, f, indent=2)
             
         print(f"\n📄 Detailed report saved to: {report_path}")